@@ -1,53 +1,165 @@
-import os
+from __future__ import annotations
+
 import time
+_import_started = time.perf_counter()
+
+import os
+import bisect
+import codecs
+import sys
+import csv
+import gzip
+import html
+import io
+import json
+import hashlib
+import heapq
+import importlib
+import itertools
+import re
+import socket
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 import pytz
-from typing import Dict, Any
-import sqlite3
+import secrets
+from typing import Dict, Any, NamedTuple
+from urllib.parse import urlsplit, urlunsplit
 
 import requests
 from apscheduler.schedulers.background import BackgroundScheduler
-from telebot import TeleBot, types
-from telebot.util import quick_markup
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, ForeignKey, Boolean, Float
-from sqlalchemy.orm import sessionmaker, relationship, declarative_base
+from apscheduler.triggers.cron import CronTrigger
+from sqlalchemy import create_engine, event, inspect, text, Column, Integer, String, DateTime, ForeignKey, Boolean, Float, Index, and_, or_, false, bindparam
+from sqlalchemy.orm import sessionmaker, scoped_session, relationship, declarative_base, joinedload
+from sqlalchemy.pool import StaticPool
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
 from werkzeug.security import generate_password_hash, check_password_hash
 
 # ----- Config -----
 TELEGRAM_BOT_TOKEN = os.getenv('TELEGRAM_BOT_TOKEN', '8039732483:AAELszNcgl0saq6LKVAT0Dr5rPZJEPEi2Q4')
-DATABASE_URL = 'sqlite:///uptime.db'
+DATABASE_URL = os.getenv('DATABASE_URL', 'sqlite:///uptime.db')
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', 10))
+DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', 20))
+DB_POOL_TIMEOUT = int(os.getenv('DB_POOL_TIMEOUT', 30))  # seconds to wait for a free connection
+DB_POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', 1800))  # seconds before a connection is replaced
 MAX_PASSWORD_ATTEMPTS = 3
+MIN_CHECK_INTERVAL = 10  # seconds
+ADAPTIVE_STABLE_CHECKS = 5  # successful checks in a row before an adaptive interval stretches
+ADAPTIVE_BACKOFF = 1.5  # stretch factor per stable run
+ADAPTIVE_MAX_FACTOR = 4  # default ceiling is this many times the configured interval
+ADAPTIVE_MIN_FACTOR = 4  # default fast recheck is the configured interval divided by this
+BULK_MAX_ROWS = 5000
+BULK_MAX_BYTES = 2 * 1024 * 1024
+MONITORS_PAGE_SIZE = 8
+TELEGRAM_MESSAGE_LIMIT = 4000  # Telegram allows 4096 characters; keep some headroom for multi-unit characters
+INCIDENTS_DAYS = 7  # window of the /incidents view
+INCIDENTS_PER_MONITOR = 5
+STATUS_PAGE_PORT = int(os.getenv('STATUS_PAGE_PORT', 8081))  # 0 disables the status page server
+STATUS_PAGE_BASE_URL = os.getenv('STATUS_PAGE_BASE_URL', f'http://localhost:{STATUS_PAGE_PORT}')
+STATUS_PAGE_MAX_AGE = 15  # seconds clients and proxies may cache a status page
+STATUS_RENDER_CACHE_SIZE = 1024
+ROLLUP_FLUSH_SECONDS = 60
+LATENCY_BUCKETS = (50, 100, 200, 300, 500, 750, 1000, 1500, 2000, 3000, 5000, 10000)  # ms, upper bounds
+DIGEST_WINDOW_START = int(os.getenv('DIGEST_WINDOW_START', 2))  # hour of day in INDIAN_TIMEZONE
+DIGEST_WINDOW_HOURS = int(os.getenv('DIGEST_WINDOW_HOURS', 3))  # digests are spread across this window
+DIGEST_WEEKDAY = 0  # weekly digests go out on Mondays
+DIGEST_MAX_PER_SECOND = 20  # stays under Telegram's bulk message limit
+DIGEST_TICK_SECONDS = 5
+DIGEST_MODES = ('off', 'daily', 'weekly')
+PROBE_MAX_BYTES = int(os.getenv('PROBE_MAX_BYTES', 64 * 1024))  # default body cap per check
+PROBE_CHUNK_SIZE = 8192
+PROBE_REGEX_OVERLAP = 1024  # characters kept between chunks so regex matches can span them
+CHECK_MODES = ('get', 'head', 'headers')
+CRON_METHODS = ('GET', 'POST', 'PUT', 'PATCH', 'DELETE', 'HEAD')
+CRON_MISFIRE_POLICIES = ('skip', 'once', 'all')  # what to do with runs missed while the engine was down
+CRON_MISFIRE_GRACE = 60  # seconds a run may be late and still count as on time
+CRON_MAX_CATCHUP = 100  # most missed runs replayed per job under the 'all' policy
+CRON_TICK_SECONDS = 1
+CRON_WORKERS = int(os.getenv('CRON_WORKERS', 16))  # concurrent cron requests
+CRON_REQUEST_TIMEOUT = 30  # seconds
+CRON_HISTORY_DAYS = 30
+CRON_HISTORY_SHOWN = 5
+PROBE_PHASES = ('dns', 'connect', 'tls', 'ttfb', 'transfer')
+PHASE_BASELINE_WEIGHT = 0.1  # EWMA weight of the newest sample in the per-phase baseline
+PHASE_REGRESSION_MS = 200  # a phase must be this much slower than usual...
+PHASE_REGRESSION_RATIO = 2.0  # ...and this many times its baseline to count as regressed
 INDIAN_TIMEZONE = pytz.timezone('Asia/Kolkata')
 LANGUAGE = 'en'  # 'en' or 'hi'
-
-bot = TeleBot(TELEGRAM_BOT_TOKEN)
+APP_ROLES = tuple(role.strip() for role in os.getenv('APP_ROLES', 'bot,probe,status').split(',') if role.strip())
+STARTUP_REPORT = os.getenv('STARTUP_REPORT')  # optional path for a JSON report of startup timings
+ROLE_SYNC_SECONDS = int(os.getenv('ROLE_SYNC_SECONDS', 30))  # how often nodes without the bot role pick up changes
+
+# ----- Lazy initialization -----
+
+class LazyModule:
+    """Stand-in for a module that is imported on first attribute access"""
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr: str):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+# telebot is only imported once a bot is actually needed, so probe-only
+# workers (and plain imports of this module) never pay for it
+types = LazyModule('telebot.types')
+telebot_util = LazyModule('telebot.util')
+
+def quick_markup(values: dict, row_width: int = 2):
+    return telebot_util.quick_markup(values, row_width=row_width)
+
+class LazyBot:
+    """Records handler registrations until setup() creates the real TeleBot"""
+
+    def __init__(self, token: str):
+        self._token = token
+        self._bot = None
+        self._handlers = []
+
+    def message_handler(self, **kwargs):
+        def decorator(handler):
+            self._handlers.append(('message_handler', kwargs, handler))
+            return handler
+        return decorator
+
+    def callback_query_handler(self, **kwargs):
+        def decorator(handler):
+            self._handlers.append(('callback_query_handler', kwargs, handler))
+            return handler
+        return decorator
+
+    @property
+    def is_ready(self) -> bool:
+        return self._bot is not None
+
+    def setup(self):
+        if self._bot is None:
+            from telebot import TeleBot
+            real_bot = TeleBot(self._token)
+            for kind, kwargs, handler in self._handlers:
+                getattr(real_bot, kind)(**kwargs)(handler)
+            self._bot = real_bot
+        return self._bot
+
+    def __getattr__(self, name: str):
+        if self._bot is None:
+            raise RuntimeError("The bot is not set up yet; call create_app() first")
+        return getattr(self._bot, name)
+
+bot = LazyBot(TELEGRAM_BOT_TOKEN)
+active_roles: set = set()  # filled in by create_app()
 
 # ----- Database setup -----
 Base = declarative_base()
 
-def init_db():
-    # Check if database exists and has the correct schema
-    if os.path.exists('uptime.db'):
-        conn = sqlite3.connect('uptime.db')
-        cursor = conn.cursor()
-        
-        # Check if columns exist
-        cursor.execute("PRAGMA table_info(user)")
-        columns = [column[1] for column in cursor.fetchall()]
-        
-        # If old schema exists, drop and recreate
-        if 'language' not in columns or 'notifications' not in columns:
-            print("Old database schema detected. Recreating database...")
-            os.remove('uptime.db')
-    
-    engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
-    Base.metadata.create_all(engine)
-    return engine
-
-engine = init_db()
-Session = sessionmaker(bind=engine)
-db_session = Session()
-
 class User(Base):
     __tablename__ = 'user'
     id = Column(Integer, primary_key=True)
@@ -56,6 +168,9 @@ class User(Base):
     password_hash = Column(String, nullable=False)
     language = Column(String, default='en')
     notifications = Column(Boolean, default=True)
+    status_token = Column(String, unique=True)  # public status page id, NULL when disabled
+    digest = Column(String, default='off')  # 'off', 'daily' or 'weekly'
+    updated_at = Column(DateTime, default=datetime.utcnow)  # see touch_updated_at()
     monitors = relationship("Monitor", back_populates="user")
 
 class Monitor(Base):
@@ -71,21 +186,212 @@ class Monitor(Base):
     uptime_percentage = Column(Float, default=100.0)
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow)  # see touch_updated_at()
+    check_mode = Column(String, default='get')  # 'get', 'head' or 'headers'
+    max_bytes = Column(Integer)  # body cap in bytes, PROBE_MAX_BYTES when empty
+    keyword = Column(String)  # optional text or regex the body must contain
+    keyword_regex = Column(Boolean, default=False)
+    timings = Column(String)  # last check's phase timings, see encode_timings()
+    timing_baseline = Column(String)  # moving average of timings on successful checks
+    adaptive = Column(Boolean, default=False)  # stretch the interval while stable, see adapt_interval()
+    min_interval = Column(Integer)  # adaptive fast recheck, seconds; derived from interval when empty
+    max_interval = Column(Integer)  # adaptive ceiling, seconds; derived from interval when empty
+    effective_interval = Column(Integer)  # current adaptive interval
+    stable_checks = Column(Integer, default=0)  # successful checks in a row
     user = relationship("User", back_populates="monitors")
 
+    # Matches the "My Monitors" ordering so each page is a single index range scan
+    __table_args__ = (
+        Index('ix_monitor_user_active_name', 'user_id', 'is_active', 'name'),
+    )
+
 class MonitorLog(Base):
     __tablename__ = 'monitor_log'
     id = Column(Integer, primary_key=True)
     monitor_id = Column(Integer, ForeignKey('monitor.id'))
     status = Column(String)
     response_time = Column(Integer)
+    timings = Column(String)
     created_at = Column(DateTime, default=datetime.utcnow)
 
-Base.metadata.create_all(engine)
+class MonitorRollup(Base):
+    """Hourly aggregate of a monitor's checks, used by reports instead of monitor_log"""
+    __tablename__ = 'monitor_rollup'
+    id = Column(Integer, primary_key=True)
+    monitor_id = Column(Integer, ForeignKey('monitor.id'), nullable=False)
+    hour = Column(DateTime, nullable=False)  # UTC start of the hour
+    checks = Column(Integer, default=0)
+    up_checks = Column(Integer, default=0)
+    response_sum = Column(Integer, default=0)  # ms, successful checks only
+    histogram = Column(String)  # comma separated counts per LATENCY_BUCKETS entry, plus overflow
+
+    __table_args__ = (
+        Index('ix_monitor_rollup_monitor_hour', 'monitor_id', 'hour', unique=True),
+        Index('ix_monitor_rollup_hour', 'hour'),
+    )
+
+class Incident(Base):
+    """One outage of a monitor, opened on up→down and closed on down→up"""
+    __tablename__ = 'incident'
+    id = Column(Integer, primary_key=True)
+    monitor_id = Column(Integer, ForeignKey('monitor.id'), nullable=False)
+    started_at = Column(DateTime, nullable=False)
+    ended_at = Column(DateTime)  # NULL while the incident is ongoing
+    duration = Column(Integer)  # seconds, set when closed
+    first_error = Column(String)
+
+    __table_args__ = (
+        Index('ix_incident_monitor_started', 'monitor_id', 'started_at'),
+    )
+
+class CronJob(Base):
+    """An HTTP request fired on a cron schedule"""
+    __tablename__ = 'cron_job'
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey('user.id'), nullable=False)
+    name = Column(String, nullable=False)
+    expression = Column(String, nullable=False)  # standard 5-field crontab line
+    timezone = Column(String, default=INDIAN_TIMEZONE.zone)
+    method = Column(String, default='GET')
+    url = Column(String, nullable=False)
+    headers = Column(String)  # JSON object
+    body = Column(String)
+    misfire = Column(String, default='once')  # one of CRON_MISFIRE_POLICIES
+    is_active = Column(Boolean, default=True)
+    next_fire_at = Column(DateTime)  # UTC; the engine resumes from here after a restart
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow)  # see touch_updated_at()
+
+    __table_args__ = (
+        Index('ix_cron_job_next_fire', 'next_fire_at'),
+        Index('ix_cron_job_user_name', 'user_id', 'name'),
+    )
+
+class CronExecution(Base):
+    __tablename__ = 'cron_execution'
+    id = Column(Integer, primary_key=True)
+    job_id = Column(Integer, ForeignKey('cron_job.id'), nullable=False)
+    scheduled_at = Column(DateTime, nullable=False)  # UTC fire time the run belongs to
+    started_at = Column(DateTime, nullable=False)
+    status_code = Column(Integer)  # NULL when no response was received
+    response_time = Column(Integer)  # ms
+    error = Column(String)
+
+    __table_args__ = (
+        Index('ix_cron_execution_job_scheduled', 'job_id', 'scheduled_at'),
+    )
+
+# Handlers change users, monitors and cron jobs through the ORM, while check
+# results and fire times are written with plain UPDATEs. Stamping only ORM
+# updates lets nodes in other processes poll for configuration changes alone.
+@event.listens_for(User, 'before_update')
+@event.listens_for(Monitor, 'before_update')
+@event.listens_for(CronJob, 'before_update')
+def touch_updated_at(mapper, connection, target) -> None:
+    target.updated_at = datetime.utcnow()
+
+def create_db_engine(url: str):
+    """Create the engine for DATABASE_URL.
+
+    SQLite stays single-file friendly (one shared connection for in-memory
+    databases, WAL and a busy timeout for files). Client/server databases get a
+    bounded, pre-pinged connection pool so several bot and probe nodes can share
+    one store.
+    """
+    if url.startswith('sqlite'):
+        kwargs = {'connect_args': {'check_same_thread': False}}
+        if url in ('sqlite://', 'sqlite:///:memory:'):
+            kwargs['poolclass'] = StaticPool
+        engine = create_engine(url, **kwargs)
+
+        @event.listens_for(engine, 'connect')
+        def set_sqlite_pragmas(dbapi_connection, _):
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA busy_timeout=5000")
+            cursor.close()
+
+        return engine
+    return create_engine(
+        url,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=True
+    )
+
+def add_missing_columns(engine) -> None:
+    """Add columns introduced after a table was first created.
+
+    create_all never alters existing tables. New columns are added as nullable
+    and backfilled with the model's scalar default, if it has one.
+    """
+    inspector = inspect(engine)
+    quote = engine.dialect.identifier_preparer.quote
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {column['name'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+                print(f"Adding column {table.name}.{column.name}...")
+                conn.execute(text(
+                    f"ALTER TABLE {quote(table.name)} ADD COLUMN {quote(column.name)} "
+                    f"{column.type.compile(dialect=engine.dialect)}"
+                ))
+                if column.default is not None and column.default.is_scalar:
+                    conn.execute(table.update().values({column.name: column.default.arg}))
+
+def init_db():
+    global engine
+    engine = create_db_engine(DATABASE_URL)
+    Session.configure(bind=engine)
+    Base.metadata.create_all(engine)
+    add_missing_columns(engine)
+    # create_all skips tables that already exist, so add any newer indexes explicitly
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+    return engine
+
+def delete_monitor_rows(session, monitor_ids: list) -> None:
+    """Delete the rows that reference these monitors, so the monitors themselves can go"""
+    if not monitor_ids:
+        return
+    for model in (MonitorLog, Incident, MonitorRollup):
+        session.query(model).filter(model.monitor_id.in_(monitor_ids)).delete(synchronize_session=False)
+
+def check_db(engine) -> bool:
+    """Verify connectivity and that every model table and column exists; prints a report"""
+    ok = True
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    print(f"Connected to {engine.url.render_as_string(hide_password=True)} ({engine.dialect.name})")
+    inspector = inspect(engine)
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            print(f"  missing table: {table.name}")
+            ok = False
+            continue
+        existing = {column['name'] for column in inspector.get_columns(table.name)}
+        missing = [column.name for column in table.columns if column.name not in existing]
+        if missing:
+            print(f"  {table.name}: missing columns {', '.join(missing)}")
+            ok = False
+    print("Schema OK" if ok else "Schema check failed")
+    return ok
+
+# Bound by init_db(); nothing connects to the database at import time
+engine = None
+Session = sessionmaker()
+# The handlers share one session, created on first use
+db_session = scoped_session(Session, scopefunc=lambda: None)
 
 # ----- Scheduler -----
-scheduler = BackgroundScheduler()
-scheduler.start()
+scheduler = BackgroundScheduler()  # started by create_app()
 
 # ----- User states -----
 user_states: Dict[int, Dict[str, Any]] = {}
@@ -110,7 +416,7 @@ translations = {
         'settings': "⚙️ Settings",
         'logout': "❌ Logout",
         'no_monitors': "You have no monitors yet. Add one using '➕ Add Monitor'.",
-        'monitor_details': "🔍 Monitor Details:\n\nName: {name}\nURL: {url}\nStatus: {status}\nLast checked: {last_checked}\nResponse time: {response_time}ms\nUptime: {uptime}%\nInterval: {interval}s",
+        'monitor_details': "🔍 Monitor Details:\n\nName: {name}\nURL: {url}\nStatus: {status}\nLast checked: {last_checked}\nResponse time: {response_time}ms\nUptime: {uptime}%\nInterval: {interval}\nCheck mode: {mode}\nPhases: {timings}",
         'enter_monitor_name': "Enter monitor name:",
         'enter_monitor_url': "Enter URL to monitor (must start with http:// or https://):",
         'invalid_url': "Invalid URL format. Enter a URL starting with http:// or https://:",
@@ -134,6 +440,75 @@ translations = {
         'notifications_on': "🔔 Notifications: ON",
         'notifications_off': "🔔 Notifications: OFF",
         'notifications_toggled': "Notifications have been {status}.",
+        'import_instructions': "📥 Send a CSV or JSON file to import monitors.\n\nColumns: action, id, name, url, interval, is_active, check_mode, max_bytes, keyword, keyword_regex, adaptive, min_interval, max_interval\ncheck_mode is get, head or headers; keyword (text, or a regex when keyword_regex is true) only applies to get.\nWith adaptive true, the interval stretches up to max_interval while the site is up and drops to min_interval after a failure.\nAction is one of upsert (default), create, update or delete. Rows are matched by id, or by name if no id is given.\n\nUse /export or /export json to download your current monitors in the same format.",
+        'import_unsupported': "❌ Unsupported file. Send a .csv or .json document.",
+        'import_too_large': "❌ File is too large. Split it into smaller files of at most {max_rows} rows.",
+        'import_failed': "❌ Could not read the file: {error}",
+        'import_result': "📥 Import finished.\n\nCreated: {created}\nUpdated: {updated}\nDeleted: {deleted}\nFailed: {failed}",
+        'import_errors': "Errors:\n{errors}",
+        'export_empty': "You have no monitors to export.",
+        'incidents_title': "🚨 *Recent incidents* (last {days} days)",
+        'no_incidents': "✅ No outages in the last {days} days.",
+        'incident_summary': "*{name}*: {count} outages, SLA {sla}%, MTTR {mttr}",
+        'incident_line': "• {started} — {duration}: {error}",
+        'incident_ongoing': "ongoing for {duration}",
+        'status_page_link': "🌐 Your public status page:\n{url}\n\nJSON: {url}.json\nAdd ?ids=1,2 to show only some monitors. Use /statuspage reset for a new link or /statuspage off to disable it.",
+        'status_page_disabled': "🌐 Your public status page has been disabled.",
+        'digest_setting': "📬 Digest: {mode}",
+        'digest_off': "OFF",
+        'digest_daily': "Daily",
+        'digest_weekly': "Weekly",
+        'digest_title_daily': "📬 *Daily report* (last 24 hours)",
+        'digest_title_weekly': "📬 *Weekly report* (last 7 days)",
+        'digest_line': "*{name}*: uptime {uptime}%, p95 {p95}ms, {incidents} incidents ({downtime} down)",
+        'cron_enter_name': "Send a name for the new cron job:",
+        'cron_enter_schedule': "Send the schedule as a cron expression (minute hour day month weekday), optionally followed by a timezone.\n\nExamples:\n*/15 * * * *\n0 9 * * mon-fri Europe/London\n\nThe default timezone is Asia/Kolkata.",
+        'cron_invalid_schedule': "❌ Invalid schedule: {error}\nPlease try again:",
+        'cron_enter_request': "Send the request to make. First line: METHOD URL (the method defaults to GET), then optional 'Header: value' lines, then an empty line and the body.\n\nExample:\nPOST https://example.com/hook\nContent-Type: application/json\n\n{{\"ping\": true}}",
+        'cron_invalid_request': "❌ Invalid request: {error}\nPlease try again:",
+        'cron_added': "✅ Cron job '{name}' created. Next run: {next_fire}",
+        'no_cron_jobs': "You don't have any cron jobs yet. Use /addcron to create one.",
+        'cron_list_title': "⏰ Your cron jobs:",
+        'cron_details': "⏰ {name}\n\nSchedule: {expression} ({timezone})\nRequest: {method} {url}\nStatus: {state}\nNext run: {next_fire}\nMissed runs: {misfire}\n\nRecent runs:\n{history}",
+        'cron_active': "Active",
+        'cron_paused': "Paused",
+        'cron_misfire_skip': "skip",
+        'cron_misfire_once': "run once",
+        'cron_misfire_all': "run all",
+        'cron_no_runs': "No runs yet",
+        'cron_run_line': "{time}: {result} ({response_time}ms)",
+        'cron_toggle': "⏯️ Pause/Resume",
+        'cron_misfire': "🔁 Missed runs",
+        'cron_delete': "🗑️ Delete",
+        'cron_deleted': "Cron job '{name}' deleted",
+        'cron_not_found': "Cron job not found",
+        'cron_restart': "Something went wrong. Please start again with /addcron",
+        'back': "⬅️ Back",
+        'monitors_page': "📊 Monitors ({filter}) — page {page}",
+        'no_monitors_filter': "No monitors match this filter.",
+        'filter_all': "📋 All",
+        'filter_down': "🔴 Down",
+        'filter_paused': "⏸️ Paused",
+        'page_prev': "◀️ Prev",
+        'page_next': "Next ▶️",
+        'check_mode': "🔁 Mode",
+        'mode_get': "GET body (up to {max_bytes} bytes)",
+        'mode_head': "HEAD only",
+        'mode_headers': "GET headers only",
+        'mode_keyword': "{mode}, must contain '{keyword}'",
+        'mode_regex': "{mode}, must match /{keyword}/",
+        'mode_changed': "Check mode: {mode}",
+        'adaptive_toggle': "⚡ Adaptive",
+        'interval_fixed': "{interval}s",
+        'interval_adaptive': "{interval}s now (adaptive, {low}s to {high}s)",
+        'keyword_not_found': "Keyword not found in the first {max_bytes} bytes",
+        'phase_dns': "DNS",
+        'phase_connect': "Connect",
+        'phase_tls': "TLS",
+        'phase_ttfb': "TTFB",
+        'phase_transfer': "Transfer",
+        'phase_regressed': "Slow phase: {phase} {current}ms (usually {baseline}ms)",
+        'monitor_slow_alert': "Monitor is responding slowly",
         'help': """
 🤖 *Uptime Monitor Bot Help*
 
@@ -141,6 +516,12 @@ translations = {
 /start - Start the bot
 /help - Show this help message
 /stats - Show your monitoring statistics
+/import - Import monitors from a CSV or JSON file
+/export - Export your monitors as CSV (or /export json)
+/incidents - Show recent outages
+/statuspage - Get a public status page link (/statuspage reset for a new link, /statuspage off to disable)
+/cron - List your cron jobs
+/addcron - Create a cron job that calls a URL on a schedule
 
 *Features:*
 - Monitor website uptime
@@ -185,7 +566,7 @@ Average response time: {avg_response_time}ms
         'settings': "⚙️ सेटिंग्स",
         'logout': "❌ लॉगआउट",
         'no_monitors': "आपके पास अभी तक कोई मॉनिटर नहीं है। '➕ मॉनिटर जोड़ें' का उपयोग करके एक जोड़ें।",
-        'monitor_details': "🔍 मॉनिटर विवरण:\n\nनाम: {name}\nURL: {url}\nस्थिति: {status}\nअंतिम जांच: {last_checked}\nप्रतिक्रिया समय: {response_time}ms\nअपटाइम: {uptime}%\nअंतराल: {interval}s",
+        'monitor_details': "🔍 मॉनिटर विवरण:\n\nनाम: {name}\nURL: {url}\nस्थिति: {status}\nअंतिम जांच: {last_checked}\nप्रतिक्रिया समय: {response_time}ms\nअपटाइम: {uptime}%\nअंतराल: {interval}\nजांच मोड: {mode}\nचरण: {timings}",
         'enter_monitor_name': "मॉनिटर का नाम दर्ज करें:",
         'enter_monitor_url': "मॉनिटर करने के लिए URL दर्ज करें (http:// या https:// से शुरू होना चाहिए):",
         'invalid_url': "अमान्य URL प्रारूप। http:// या https:// से शुरू होने वाला URL दर्ज करें:",
@@ -209,6 +590,75 @@ Average response time: {avg_response_time}ms
         'notifications_on': "🔔 सूचनाएं: चालू",
         'notifications_off': "🔔 सूचनाएं: बंद",
         'notifications_toggled': "सूचनाएं {status} कर दी गई हैं।",
+        'import_instructions': "📥 मॉनिटर आयात करने के लिए CSV या JSON फ़ाइल भेजें।\n\nकॉलम: action, id, name, url, interval, is_active, check_mode, max_bytes, keyword, keyword_regex, adaptive, min_interval, max_interval\ncheck_mode get, head या headers है; keyword (टेक्स्ट, या keyword_regex true होने पर regex) केवल get पर लागू होता है।\nadaptive true होने पर साइट चालू रहते अंतराल max_interval तक बढ़ता है और विफलता के बाद min_interval पर आ जाता है।\naction इनमें से एक है: upsert (डिफ़ॉल्ट), create, update या delete। पंक्तियों का मिलान id से, या id न होने पर name से किया जाता है।\n\nअपने मौजूदा मॉनिटर इसी प्रारूप में डाउनलोड करने के लिए /export या /export json का उपयोग करें।",
+        'import_unsupported': "❌ असमर्थित फ़ाइल। .csv या .json दस्तावेज़ भेजें।",
+        'import_too_large': "❌ फ़ाइल बहुत बड़ी है। इसे अधिकतम {max_rows} पंक्तियों वाली छोटी फ़ाइलों में बांटें।",
+        'import_failed': "❌ फ़ाइल पढ़ी नहीं जा सकी: {error}",
+        'import_result': "📥 आयात पूर्ण।\n\nबनाए गए: {created}\nअपडेट किए गए: {updated}\nहटाए गए: {deleted}\nविफल: {failed}",
+        'import_errors': "त्रुटियां:\n{errors}",
+        'export_empty': "आपके पास निर्यात करने के लिए कोई मॉनिटर नहीं है।",
+        'incidents_title': "🚨 *हाल की घटनाएं* (पिछले {days} दिन)",
+        'no_incidents': "✅ पिछले {days} दिनों में कोई आउटेज नहीं।",
+        'incident_summary': "*{name}*: {count} आउटेज, SLA {sla}%, MTTR {mttr}",
+        'incident_line': "• {started} — {duration}: {error}",
+        'incident_ongoing': "{duration} से जारी",
+        'status_page_link': "🌐 आपका सार्वजनिक स्टेटस पेज:\n{url}\n\nJSON: {url}.json\nकेवल कुछ मॉनिटर दिखाने के लिए ?ids=1,2 जोड़ें। नए लिंक के लिए /statuspage reset या बंद करने के लिए /statuspage off का उपयोग करें।",
+        'status_page_disabled': "🌐 आपका सार्वजनिक स्टेटस पेज बंद कर दिया गया है।",
+        'digest_setting': "📬 रिपोर्ट: {mode}",
+        'digest_off': "बंद",
+        'digest_daily': "दैनिक",
+        'digest_weekly': "साप्ताहिक",
+        'digest_title_daily': "📬 *दैनिक रिपोर्ट* (पिछले 24 घंटे)",
+        'digest_title_weekly': "📬 *साप्ताहिक रिपोर्ट* (पिछले 7 दिन)",
+        'digest_line': "*{name}*: अपटाइम {uptime}%, p95 {p95}ms, {incidents} घटनाएं ({downtime} डाउन)",
+        'cron_enter_name': "नए क्रॉन जॉब का नाम भेजें:",
+        'cron_enter_schedule': "शेड्यूल को क्रॉन एक्सप्रेशन (minute hour day month weekday) के रूप में भेजें, चाहें तो उसके बाद टाइमज़ोन भी।\n\nउदाहरण:\n*/15 * * * *\n0 9 * * mon-fri Europe/London\n\nडिफ़ॉल्ट टाइमज़ोन Asia/Kolkata है।",
+        'cron_invalid_schedule': "❌ अमान्य शेड्यूल: {error}\nकृपया फिर से प्रयास करें:",
+        'cron_enter_request': "भेजा जाने वाला अनुरोध भेजें। पहली पंक्ति: METHOD URL (डिफ़ॉल्ट मेथड GET है), फिर वैकल्पिक 'Header: value' पंक्तियाँ, फिर एक खाली पंक्ति और बॉडी।\n\nउदाहरण:\nPOST https://example.com/hook\nContent-Type: application/json\n\n{{\"ping\": true}}",
+        'cron_invalid_request': "❌ अमान्य अनुरोध: {error}\nकृपया फिर से प्रयास करें:",
+        'cron_added': "✅ क्रॉन जॉब '{name}' बनाया गया। अगला रन: {next_fire}",
+        'no_cron_jobs': "आपके पास अभी कोई क्रॉन जॉब नहीं है। बनाने के लिए /addcron का उपयोग करें।",
+        'cron_list_title': "⏰ आपके क्रॉन जॉब:",
+        'cron_details': "⏰ {name}\n\nशेड्यूल: {expression} ({timezone})\nअनुरोध: {method} {url}\nस्थिति: {state}\nअगला रन: {next_fire}\nछूटे हुए रन: {misfire}\n\nहाल के रन:\n{history}",
+        'cron_active': "सक्रिय",
+        'cron_paused': "रुका हुआ",
+        'cron_misfire_skip': "छोड़ें",
+        'cron_misfire_once': "एक बार चलाएं",
+        'cron_misfire_all': "सभी चलाएं",
+        'cron_no_runs': "अभी तक कोई रन नहीं",
+        'cron_run_line': "{time}: {result} ({response_time}ms)",
+        'cron_toggle': "⏯️ रोकें/फिर शुरू करें",
+        'cron_misfire': "🔁 छूटे हुए रन",
+        'cron_delete': "🗑️ हटाएं",
+        'cron_deleted': "क्रॉन जॉब '{name}' हटाया गया",
+        'cron_not_found': "क्रॉन जॉब नहीं मिला",
+        'cron_restart': "कुछ गलत हो गया। कृपया /addcron से फिर से शुरू करें",
+        'back': "⬅️ वापस",
+        'monitors_page': "📊 मॉनिटर्स ({filter}) — पृष्ठ {page}",
+        'no_monitors_filter': "इस फ़िल्टर से कोई मॉनिटर मेल नहीं खाता।",
+        'filter_all': "📋 सभी",
+        'filter_down': "🔴 डाउन",
+        'filter_paused': "⏸️ रुके हुए",
+        'page_prev': "◀️ पिछला",
+        'page_next': "अगला ▶️",
+        'check_mode': "🔁 मोड",
+        'mode_get': "GET बॉडी ({max_bytes} बाइट्स तक)",
+        'mode_head': "केवल HEAD",
+        'mode_headers': "केवल GET हेडर",
+        'mode_keyword': "{mode}, '{keyword}' होना चाहिए",
+        'mode_regex': "{mode}, /{keyword}/ से मेल खाना चाहिए",
+        'mode_changed': "जांच मोड: {mode}",
+        'adaptive_toggle': "⚡ अनुकूली",
+        'interval_fixed': "{interval}s",
+        'interval_adaptive': "अभी {interval}s (अनुकूली, {low}s से {high}s)",
+        'keyword_not_found': "पहले {max_bytes} बाइट्स में कीवर्ड नहीं मिला",
+        'phase_dns': "DNS",
+        'phase_connect': "कनेक्ट",
+        'phase_tls': "TLS",
+        'phase_ttfb': "TTFB",
+        'phase_transfer': "ट्रांसफ़र",
+        'phase_regressed': "धीमा चरण: {phase} {current}ms (सामान्यतः {baseline}ms)",
+        'monitor_slow_alert': "मॉनिटर धीमी प्रतिक्रिया दे रहा है",
         'help': """
 🤖 *अपटाइम मॉनिटर बॉट सहायता*
 
@@ -216,6 +666,12 @@ Average response time: {avg_response_time}ms
 /start - बॉट शुरू करें
 /help - यह सहायता संदेश दिखाएं
 /stats - अपने मॉनिटरिंग आंकड़े दिखाएं
+/import - CSV या JSON फ़ाइल से मॉनिटर आयात करें
+/export - अपने मॉनिटर CSV के रूप में निर्यात करें (या /export json)
+/incidents - हाल के आउटेज दिखाएं
+/statuspage - सार्वजनिक स्टेटस पेज लिंक पाएं (नए लिंक के लिए /statuspage reset, बंद करने के लिए /statuspage off)
+/cron - अपने क्रॉन जॉब देखें
+/addcron - शेड्यूल पर URL कॉल करने वाला क्रॉन जॉब बनाएं
 
 *विशेषताएं:*
 - वेबसाइट अपटाइम मॉनिटर करें
@@ -245,9 +701,9 @@ Average response time: {avg_response_time}ms
 }
 
 def t(key: str, **kwargs) -> str:
-    """Get translated text"""
-    lang = LANGUAGE
-    if 'chat_id' in kwargs:
+    """Get translated text; pass lang= instead of chat_id= when the language is already known"""
+    lang = kwargs.get('lang') or LANGUAGE
+    if 'chat_id' in kwargs and 'lang' not in kwargs:
         user = get_user_by_chat(kwargs['chat_id'])
         if user and user.language:
             lang = user.language
@@ -255,42 +711,511 @@ def t(key: str, **kwargs) -> str:
 
 # ----- Helper functions -----
 
-def schedule_monitor(monitor: Monitor) -> None:
-    job_id = f"monitor_{monitor.id}"
-    if scheduler.get_job(job_id):
-        scheduler.remove_job(job_id)
-    if monitor.is_active:
-        scheduler.add_job(
-            func=check_monitor,
-            args=[monitor.id],
-            trigger='interval',
-            seconds=monitor.interval,
-            id=job_id,
-            replace_existing=True
-        )
+class ProbeResult(NamedTuple):
+    status: str
+    response_time: int
+    message: str
+    timings: tuple = None  # milliseconds per PROBE_PHASES entry
+    message_args: dict = None  # set when message is a translation key, see probe_message()
+
+class ProbeSettings(NamedTuple):
+    mode: str = 'get'
+    max_bytes: int = PROBE_MAX_BYTES
+    keyword: str = None
+    keyword_regex: bool = False
+
+def probe_message(result: ProbeResult, lang: str) -> str:
+    """A probe's error message in the owner's language; one probe may serve several owners"""
+    if result.message_args is not None:
+        return t(result.message, lang=lang, **result.message_args)
+    return result.message
+
+def probe_settings(monitor: Monitor) -> ProbeSettings:
+    return ProbeSettings(
+        mode=monitor.check_mode or 'get',
+        max_bytes=monitor.max_bytes or PROBE_MAX_BYTES,
+        keyword=monitor.keyword or None,
+        keyword_regex=bool(monitor.keyword_regex)
+    )
+
+def adaptive_bounds(monitor: Monitor) -> tuple:
+    """(fast recheck, ceiling) in seconds for an adaptive monitor"""
+    low = max(monitor.min_interval or monitor.interval // ADAPTIVE_MIN_FACTOR, MIN_CHECK_INTERVAL)
+    high = max(monitor.max_interval or monitor.interval * ADAPTIVE_MAX_FACTOR, low)
+    return low, high
+
+def check_interval(monitor: Monitor) -> int:
+    """Seconds between checks right now: the adaptive interval if enabled, else the configured one"""
+    if not monitor.adaptive or not monitor.effective_interval:
+        return monitor.interval
+    low, high = adaptive_bounds(monitor)
+    return min(max(monitor.effective_interval, low), high)
+
+def adapt_interval(monitor: Monitor, status: str) -> None:
+    """Move an adaptive monitor's interval after a check.
+
+    A failure, or any check during an incident, drops to the fast recheck.
+    Recovery returns to the configured interval, and every ADAPTIVE_STABLE_CHECKS
+    successful checks in a row stretch it by ADAPTIVE_BACKOFF up to the ceiling.
+    """
+    if not monitor.adaptive:
+        monitor.effective_interval = None
+        monitor.stable_checks = 0
+        return
+    low, high = adaptive_bounds(monitor)
+    if status != 'up':
+        monitor.stable_checks = 0
+        interval = low
+    elif monitor.status != 'up':
+        monitor.stable_checks = 1
+        interval = monitor.interval
+    else:
+        monitor.stable_checks = (monitor.stable_checks or 0) + 1
+        interval = check_interval(monitor)
+        if monitor.stable_checks % ADAPTIVE_STABLE_CHECKS == 0:
+            interval = int(interval * ADAPTIVE_BACKOFF)
+    monitor.effective_interval = min(max(interval, low), high)
+
+# The probe path works on compact copies of active monitors instead of ORM
+# objects, so a check only touches the database to persist its result. Every
+# monitor change goes through schedule_monitor(), which keeps the copies current.
+
+MONITOR_CONFIG_FIELDS = ('id', 'user_id', 'name', 'url', 'interval', 'is_active', 'check_mode', 'max_bytes',
+                         'keyword', 'keyword_regex', 'adaptive', 'min_interval', 'max_interval')
+MONITOR_STATE_FIELDS = ('status', 'response_time', 'last_checked', 'uptime_percentage', 'timings',
+                        'timing_baseline', 'effective_interval', 'stable_checks')  # written by record_check()
+
+class MonitorRecord:
+    """An active monitor plus its owner's chat_id, language and notification flag.
+
+    Attribute names match Monitor, so probe_settings(), the interval helpers and
+    the status page helpers accept either; record_check() needs a record.
+    """
+    __slots__ = MONITOR_CONFIG_FIELDS + MONITOR_STATE_FIELDS + ('chat_id', 'language', 'notifications')
+
+monitor_registry: Dict[int, MonitorRecord] = {}
+
+def register_monitor(monitor: Monitor, user: User = None, reset: tuple = ()) -> None:
+    """Refresh the registry copy of a monitor, or drop it if the monitor is paused.
+
+    reset names the check state fields the caller changed; those are taken from
+    the monitor instead of the existing copy.
+    """
+    if not monitor.is_active:
+        monitor_registry.pop(monitor.id, None)
+        return
+    user = user or monitor.user
+    current = monitor_registry.get(monitor.id)
+    record = MonitorRecord()
+    for name in MONITOR_CONFIG_FIELDS:
+        setattr(record, name, getattr(monitor, name))
+    # A probe may have moved on since the handler loaded this row, so keep the newer check state
+    source = current or monitor
+    for name in MONITOR_STATE_FIELDS:
+        setattr(record, name, getattr(monitor if name in reset else source, name))
+    record.chat_id = user.chat_id if user else None
+    record.language = (user.language if user else None) or LANGUAGE
+    record.notifications = bool(user and user.notifications)
+    monitor_registry[monitor.id] = record
+
+def update_registry_owner(user: User, logged_out: bool = False) -> None:
+    """Apply a change to a user's chat, language or notification setting to their monitors.
+
+    After a logout the monitors keep running but have nobody to alert.
+    """
+    for record in list(monitor_registry.values()):
+        if record.user_id == user.id:
+            record.chat_id = None if logged_out else user.chat_id
+            record.language = user.language or LANGUAGE
+            record.notifications = bool(user.notifications) and not logged_out
+
+def persist_checks(session, records: list) -> None:
+    """Write the check state of the given records with a single executemany UPDATE"""
+    session.execute(
+        Monitor.__table__.update().where(Monitor.id == bindparam('monitor_id')),
+        [dict({name: getattr(record, name) for name in MONITOR_STATE_FIELDS}, monitor_id=record.id)
+         for record in records]
+    )
+
+# Monitors that hit the same target share one probe job. Each group records its
+# members and their intervals, and the job runs at the shortest one.
+probe_groups: Dict[str, Dict[str, Any]] = {}
+monitor_groups: Dict[int, str] = {}
+probe_lock = threading.Lock()
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+def normalize_url(url: str) -> str:
+    """Canonical form of a URL so equivalent spellings share one probe"""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    if ':' in host:
+        host = f"[{host}]"
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    if parts.username:
+        userinfo = parts.username + (f":{parts.password}" if parts.password else '')
+        host = f"{userinfo}@{host}"
+    return urlunsplit((scheme, host, parts.path or '/', parts.query, ''))
+
+def probe_key(monitor: Monitor) -> str:
+    """Group key: the normalized target plus every setting that changes the request"""
+    return json.dumps([normalize_url(monitor.url), *probe_settings(monitor)])
+
+def probe_job_id(key: str) -> str:
+    return "probe_" + hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+
+def _assign_probe_group(monitor: Monitor) -> set:
+    """Move a monitor into the group for its current settings; returns the groups touched"""
+    touched = set()
+    with probe_lock:
+        old_key = monitor_groups.pop(monitor.id, None)
+        if old_key is not None:
+            probe_groups[old_key]['members'].pop(monitor.id, None)
+            touched.add(old_key)
+        if monitor.is_active:
+            key = probe_key(monitor)
+            group = probe_groups.setdefault(key, {
+                'url': normalize_url(monitor.url),
+                'settings': probe_settings(monitor),
+                'members': {}
+            })
+            group['members'][monitor.id] = check_interval(monitor)
+            monitor_groups[monitor.id] = key
+            touched.add(key)
+    return touched
+
+def reschedule_probe_group(key: str, delay: float = None) -> None:
+    job_id = probe_job_id(key)
+    with probe_lock:
+        group = probe_groups.get(key)
+        if group is not None and not group['members']:
+            del probe_groups[key]
+            group = None
+        interval = min(group['members'].values()) if group else None
+
+    if 'probe' not in active_roles:
+        return
+    job = scheduler.get_job(job_id)
+    if interval is None:
+        if job:
+            scheduler.remove_job(job_id)
+        return
+    # Keep the running job (and its phase) if the group's cadence didn't change
+    if job and delay is None and job.trigger.interval.total_seconds() == interval:
+        return
 
-def check_monitor(monitor_id: int) -> None:
+    kwargs = {}
+    if delay is not None:
+        kwargs['next_run_time'] = datetime.now(pytz.utc) + timedelta(seconds=delay)
+    scheduler.add_job(
+        func=check_probe_group,
+        args=[key],
+        trigger='interval',
+        seconds=interval,
+        id=job_id,
+        replace_existing=True,
+        **kwargs
+    )
+
+def schedule_monitor(monitor: Monitor, delay: float = None, reset: tuple = ()) -> None:
+    # Every monitor change goes through here, so keep its registry copy and status page entry in sync too
+    register_monitor(monitor, reset=reset)
+    update_status_entry(monitor, monitor.user)
+    for key in _assign_probe_group(monitor):
+        reschedule_probe_group(key, delay)
+
+def schedule_monitors(monitors: list, user: User = None) -> None:
+    """Schedule many monitors at once, staggering first probes so they don't all fire together"""
+    touched = set()
+    for monitor in monitors:
+        register_monitor(monitor, user)
+        update_status_entry(monitor, user)
+        touched |= _assign_probe_group(monitor)
+    touched = sorted(touched)
+    count = len(touched)
+    for index, key in enumerate(touched):
+        with probe_lock:
+            group = probe_groups.get(key)
+            interval = min(group['members'].values()) if group and group['members'] else 0
+        # Spread each group's phase evenly across its own interval
+        reschedule_probe_group(key, delay=interval * index / count)
+
+def refresh_probe_interval(monitor: Monitor) -> None:
+    """Reschedule a monitor's probe group if its adaptive interval changed"""
+    interval = check_interval(monitor)
+    with probe_lock:
+        key = monitor_groups.get(monitor.id)
+        if key is None or probe_groups[key]['members'].get(monitor.id) == interval:
+            return
+        probe_groups[key]['members'][monitor.id] = interval
+    reschedule_probe_group(key)
+
+monitor_stamps: Dict[int, tuple] = {}  # monitor id -> (monitor, owner) updated_at, see sync_monitors()
+
+def read_monitor_stamps(session) -> Dict[int, tuple]:
+    rows = session.query(Monitor.id, Monitor.updated_at, User.updated_at).outerjoin(User, Monitor.user_id == User.id)
+    return {monitor_id: (monitor_at, user_at) for monitor_id, monitor_at, user_at in rows}
+
+def sync_monitors() -> None:
+    """Reschedule monitors that a bot in another process added, changed or deleted"""
     session = Session()
-    monitor = session.query(Monitor).get(monitor_id)
-    if not monitor:
+    try:
+        stamps = read_monitor_stamps(session)
+        for monitor_id in set(monitor_stamps) - set(stamps):
+            unschedule_monitor(monitor_id)
+        changed = [monitor_id for monitor_id, stamp in stamps.items() if monitor_stamps.get(monitor_id) != stamp]
+        for start in range(0, len(changed), 500):
+            monitors = (session.query(Monitor)
+                        .options(joinedload(Monitor.user))
+                        .filter(Monitor.id.in_(changed[start:start + 500])))
+            for monitor in monitors:
+                schedule_monitor(monitor)
+        monitor_stamps.clear()
+        monitor_stamps.update(stamps)
+    finally:
         session.close()
-        return
 
-    start = time.time()
+def unschedule_monitor(monitor_id: int) -> None:
+    monitor_registry.pop(monitor_id, None)
+    remove_status_entry(monitor_id)
+    with probe_lock:
+        key = monitor_groups.pop(monitor_id, None)
+        if key is not None:
+            probe_groups[key]['members'].pop(monitor_id, None)
+    if key is not None:
+        reschedule_probe_group(key)
+
+@lru_cache(maxsize=1024)
+def keyword_matcher(keyword: str, keyword_regex: bool):
+    """Return (match function, characters of overlap to keep between chunks) for a keyword.
+
+    Cached so each keyword is compiled once, not on every probe. Raises
+    re.error for an invalid regex.
+    """
+    if keyword_regex:
+        pattern = re.compile(keyword)
+        return (lambda text: pattern.search(text) is not None), PROBE_REGEX_OVERLAP
+    return (lambda text: keyword in text), len(keyword) - 1
+
+def body_decoder(resp: requests.Response):
+    """Incremental decoder for the declared response charset, falling back to UTF-8"""
+    # requests assumes ISO-8859-1 for text/* without a charset; most pages are UTF-8
+    declared = 'charset' in resp.headers.get('Content-Type', '').lower()
     try:
-        resp = requests.get(monitor.url, timeout=monitor.interval)
-        response_time = int((time.time() - start) * 1000)
-        status = 'up' if resp.status_code < 400 else 'down'
-        message = f"{resp.status_code} {resp.reason}"
+        return codecs.getincrementaldecoder(resp.encoding if declared and resp.encoding else 'utf-8')(errors='replace')
+    except LookupError:
+        return codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+def scan_body(resp: requests.Response, settings: ProbeSettings) -> bool:
+    """Stream at most max_bytes of the body, stopping as soon as the keyword matches.
+
+    Returns whether the keyword was found (always True without a keyword). The
+    body is decoded as it arrives so keywords match as text. Only
+    PROBE_REGEX_OVERLAP characters are carried between chunks, so a regex match
+    longer than that which spans a chunk boundary can be missed.
+    """
+    if settings.keyword:
+        matcher, overlap = keyword_matcher(settings.keyword, settings.keyword_regex)
+        decoder = body_decoder(resp)
+    else:
+        matcher, overlap = None, 0
+    received = 0
+    tail = ''
+    for chunk in resp.iter_content(PROBE_CHUNK_SIZE):
+        chunk = chunk[:settings.max_bytes - received]
+        received += len(chunk)
+        if matcher is not None:
+            final = received >= settings.max_bytes
+            window = tail + decoder.decode(chunk, final)
+            if matcher(window):
+                return True
+            tail = window[-overlap:] if overlap else ''
+        if received >= settings.max_bytes:
+            break
+    return matcher is None
+
+# Phase timings of the probe running on the current thread, in seconds
+_probe_timings = threading.local()
+
+def _add_phase(phase: str, seconds: float) -> None:
+    phases = getattr(_probe_timings, 'phases', None)
+    if phases is not None:
+        phases[phase] = phases.get(phase, 0.0) + seconds
+
+class TimedHTTPConnection(HTTPConnection):
+    """Connection that records DNS and TCP connect time for the running probe"""
+
+    def _new_conn(self):
+        host = self._dns_host
+        start = time.monotonic()
+        try:
+            infos = socket.getaddrinfo(host, self.port, 0, socket.SOCK_STREAM)
+            addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        except OSError:
+            addresses = []
+        resolved = time.monotonic()
+        _add_phase('dns', resolved - start)
+        try:
+            # Connect to the resolved addresses in order, as urllib3 would, so the
+            # lookup isn't repeated; Host header, SNI and certificate checks still
+            # use self.host. An IPv6 address without a route falls through to IPv4.
+            error = None
+            for address in addresses:
+                self._dns_host = address
+                try:
+                    return super()._new_conn()
+                except (NewConnectionError, ConnectTimeoutError) as e:
+                    error = e
+            if error is not None:
+                raise error
+            # The lookup failed; let urllib3 repeat it and report the error
+            self._dns_host = host
+            return super()._new_conn()
+        finally:
+            self._dns_host = host
+            _add_phase('connect', time.monotonic() - resolved)
+
+class TimedHTTPSConnection(TimedHTTPConnection, HTTPSConnection):
+    """HTTPS variant that also records the TLS handshake"""
+
+    def connect(self):
+        phases = getattr(_probe_timings, 'phases', None)
+        if phases is None:
+            phases = {}
+        before = phases.get('dns', 0.0) + phases.get('connect', 0.0)
+        start = time.monotonic()
+        try:
+            super().connect()
+        finally:
+            setup = phases.get('dns', 0.0) + phases.get('connect', 0.0) - before
+            _add_phase('tls', time.monotonic() - start - setup)
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+class TimedHTTPAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': TimedHTTPConnectionPool,
+            'https': TimedHTTPSConnectionPool,
+        }
+
+def probe_session() -> requests.Session:
+    # A fresh session per probe, so every check measures a full connection setup
+    session = requests.Session()
+    adapter = TimedHTTPAdapter()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+def encode_timings(timings: tuple) -> str:
+    """Store phase timings compactly as comma separated milliseconds"""
+    return ",".join(str(int(round(value))) for value in timings) if timings else None
+
+def decode_timings(value: str) -> tuple:
+    if not value:
+        return None
+    return tuple(int(part) for part in value.split(','))
+
+def regressed_phase(timings: tuple, baseline: tuple) -> tuple:
+    """Return (phase, current ms, baseline ms) for the phase that slowed down the most, if any"""
+    if not timings or not baseline:
+        return None
+    worst = None
+    for phase, current, usual in zip(PROBE_PHASES, timings, baseline):
+        if current - usual >= PHASE_REGRESSION_MS and current >= usual * PHASE_REGRESSION_RATIO:
+            if worst is None or current - usual > worst[1] - worst[2]:
+                worst = (phase, current, usual)
+    return worst
+
+def describe_timings(timings: tuple, chat_id: int) -> str:
+    if not timings:
+        return t('na', chat_id=chat_id)
+    return " · ".join(
+        f"{t(f'phase_{phase}', chat_id=chat_id)} {value}ms"
+        for phase, value in zip(PROBE_PHASES, timings)
+    )
+
+def probe_url(url: str, timeout: int, settings: ProbeSettings = None) -> ProbeResult:
+    settings = settings or ProbeSettings()
+    _probe_timings.phases = phases = {}
+    start = time.monotonic()
+    headers_at = None
+    message_args = None
+    stalled = False
+    try:
+        with probe_session() as session:
+            if settings.mode == 'head':
+                resp = session.head(url, timeout=timeout, allow_redirects=True)
+            else:
+                # Stream so only the bytes we actually inspect are downloaded
+                resp = session.get(url, timeout=timeout, stream=True)
+            headers_at = time.monotonic()
+            with resp:
+                status = 'up' if resp.status_code < 400 else 'down'
+                message = f"{resp.status_code} {resp.reason}"
+                if status == 'up' and settings.mode == 'get' and not scan_body(resp, settings):
+                    status = 'down'
+                    message, message_args = 'keyword_not_found', {'max_bytes': settings.max_bytes}
+        end = time.monotonic()
+        response_time = int((end - start) * 1000)
     except Exception as e:
-        response_time = monitor.interval * 1000
+        end = time.monotonic()
+        response_time = timeout * 1000
         status = 'down'
         message = str(e)
+        # A read timeout before any headers means setup finished and the server never answered
+        stalled = isinstance(e, requests.exceptions.ReadTimeout) and headers_at is None
+    finally:
+        _probe_timings.phases = None
+
+    # Whatever isn't connection setup before the headers arrived is time to first byte
+    setup = phases.get('dns', 0.0) + phases.get('connect', 0.0) + phases.get('tls', 0.0)
+    if headers_at is not None:
+        phases['ttfb'] = max(headers_at - start - setup, 0.0)
+        phases['transfer'] = end - headers_at
+    elif stalled:
+        phases['ttfb'] = max(end - start - setup, 0.0)
+    timings = tuple(phases.get(phase, 0.0) * 1000 for phase in PROBE_PHASES)
+    return ProbeResult(status, response_time, message, tuple(int(round(v)) for v in timings), message_args)
+
+def record_check(session, monitor: MonitorRecord, result: ProbeResult) -> tuple:
+    """Apply one probe result to a monitor: status, uptime, timings and log entry.
+
+    The monitor's state is updated in place; persist_checks() writes it back.
+    Returns the regressed phase (see regressed_phase) when this check starts
+    a slowdown, so the caller can alert about it once.
+    """
+    status = result.status
+    now = datetime.utcnow()
+    update_incidents(session, monitor, status, probe_message(result, monitor.language), now)
+    baseline = decode_timings(monitor.timing_baseline)
+    was_slow = regressed_phase(decode_timings(monitor.timings), baseline)
+    slow = regressed_phase(result.timings, baseline) if status == 'up' else None
+
+    monitor.timings = encode_timings(result.timings)
+    if status == 'up' and result.timings:
+        if baseline:
+            baseline = tuple(
+                usual + (current - usual) * PHASE_BASELINE_WEIGHT
+                for usual, current in zip(baseline, result.timings)
+            )
+        else:
+            baseline = result.timings
+        monitor.timing_baseline = encode_timings(baseline)
+
+    adapt_interval(monitor, status)
 
     # Update monitor status
     monitor.status = status
-    monitor.response_time = response_time
-    monitor.last_checked = datetime.utcnow()
+    monitor.response_time = result.response_time
+    monitor.last_checked = now
     
     # Calculate uptime percentage (simple moving average)
     if monitor.uptime_percentage == 100.0:  # First check
@@ -305,27 +1230,163 @@ def check_monitor(monitor_id: int) -> None:
     log = MonitorLog(
         monitor_id=monitor.id,
         status=status,
-        response_time=response_time
+        response_time=result.response_time,
+        timings=encode_timings(result.timings)
     )
     session.add(log)
-    
-    session.commit()
+    add_to_rollup(monitor.id, now, status, result.response_time)
+    update_status_entry(monitor)
+    return slow if slow and not was_slow else None
+
+def update_incidents(session, monitor: Monitor, status: str, message: str, now: datetime) -> None:
+    """Open an incident when a monitor goes down and close it when it recovers"""
+    if status == 'down' and monitor.status != 'down':
+        session.add(Incident(
+            monitor_id=monitor.id,
+            started_at=now,
+            first_error=(message or '')[:500]
+        ))
+    elif status == 'up' and monitor.status == 'down':
+        incident = (session.query(Incident)
+                    .filter(Incident.monitor_id == monitor.id, Incident.ended_at.is_(None))
+                    .order_by(Incident.started_at.desc())
+                    .first())
+        if incident:
+            incident.ended_at = now
+            incident.duration = int((now - incident.started_at).total_seconds())
+
+def pause_incidents(session, monitors: list, now: datetime) -> None:
+    """Close the open incidents of monitors being paused.
+
+    A paused monitor isn't down, so its outage stops counting as downtime. Its
+    status is reset too, so checks after resuming open a fresh incident.
+    """
+    if not monitors:
+        return
+    open_incidents = session.query(Incident).filter(
+        Incident.monitor_id.in_([monitor.id for monitor in monitors]),
+        Incident.ended_at.is_(None))
+    for incident in open_incidents:
+        incident.ended_at = now
+        incident.duration = int((now - incident.started_at).total_seconds())
+    for monitor in monitors:
+        monitor.status = 'unknown'
+
+def incident_stats(session, monitor_ids: list, since: datetime, until: datetime = None) -> Dict[int, Dict[str, Any]]:
+    """Downtime, SLA, incident count and MTTR per monitor over [since, until).
+
+    Reads only the incidents overlapping the window, so the cost grows with the
+    number of outages rather than the number of checks.
+    """
+    until = until or datetime.utcnow()
+    window = (until - since).total_seconds()
+    stats = {monitor_id: {'downtime': 0, 'incidents': 0, 'repaired': 0, 'repair_time': 0}
+             for monitor_id in monitor_ids}
+    incidents = (session.query(Incident)
+                 .filter(Incident.monitor_id.in_(monitor_ids),
+                         Incident.started_at < until,
+                         or_(Incident.ended_at.is_(None), Incident.ended_at > since))
+                 .all())
+    for incident in incidents:
+        entry = stats[incident.monitor_id]
+        start = max(incident.started_at, since)
+        end = min(incident.ended_at or until, until)
+        entry['downtime'] += max((end - start).total_seconds(), 0)
+        entry['incidents'] += 1
+        if incident.duration is not None:
+            entry['repaired'] += 1
+            entry['repair_time'] += incident.duration
+
+    for entry in stats.values():
+        entry['sla'] = 100.0 * (1 - entry['downtime'] / window) if window > 0 else 100.0
+        entry['mttr'] = entry['repair_time'] / entry['repaired'] if entry['repaired'] else None
+    return stats
+
+def format_duration(seconds: float) -> str:
+    seconds = int(seconds)
+    if seconds < 60:
+        return f"{seconds}s"
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return f"{minutes}m {seconds}s"
+    hours, minutes = divmod(minutes, 60)
+    if hours < 24:
+        return f"{hours}h {minutes}m"
+    days, hours = divmod(hours, 24)
+    return f"{days}d {hours}h"
+
+def notify(chat_id, text: str, **kwargs) -> None:
+    """Send a Telegram message, through the Bot API directly when telebot isn't loaded"""
+    if bot.is_ready:
+        bot.send_message(chat_id, text, **kwargs)
+        return
+    resp = requests.post(
+        f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage",
+        json={'chat_id': chat_id, 'text': text, **kwargs},
+        timeout=10
+    )
+    resp.raise_for_status()
 
-    # Send notification if status changed to down and notifications are enabled
-    user = monitor.user
-    if status == 'down' and user and user.notifications:
-        try:
-            bot.send_message(
-                user.chat_id,
-                f"⚠️ {t('monitor_down_alert', chat_id=user.chat_id)}\n"
-                f"{t('name', chat_id=user.chat_id)}: {monitor.name}\n"
+def describe_regression(slow: tuple, lang: str) -> str:
+    phase, current, usual = slow
+    return t('phase_regressed', phase=t(f'phase_{phase}', lang=lang),
+             current=int(current), baseline=int(usual), lang=lang)
+
+def send_alerts(monitor: MonitorRecord, result: ProbeResult, slow: tuple = None) -> None:
+    if not monitor.chat_id or not monitor.notifications:
+        return
+    lang = monitor.language
+    try:
+        # Send notification if the check failed and notifications are enabled
+        if result.status == 'down':
+            text = (
+                f"⚠️ {t('monitor_down_alert', lang=lang)}\n"
+                f"{t('name', lang=lang)}: {monitor.name}\n"
                 f"URL: {monitor.url}\n"
-                f"{t('error', chat_id=user.chat_id)}: {message}"
+                f"{t('error', lang=lang)}: {probe_message(result, lang)}"
             )
-        except Exception:
-            pass
-    
-    session.close()
+            # Name the phase where a timeout or slow failure spent its time
+            culprit = regressed_phase(result.timings, decode_timings(monitor.timing_baseline))
+            if culprit:
+                text += "\n" + describe_regression(culprit, lang)
+            notify(monitor.chat_id, text)
+        elif slow:
+            notify(
+                monitor.chat_id,
+                f"🐢 {t('monitor_slow_alert', lang=lang)}\n"
+                f"{t('name', lang=lang)}: {monitor.name}\n"
+                f"URL: {monitor.url}\n"
+                f"{describe_regression(slow, lang)}"
+            )
+    except Exception:
+        pass
+
+def check_probe_group(key: str) -> None:
+    """Probe a shared target once and fan the result out to every member monitor"""
+    with probe_lock:
+        group = probe_groups.get(key)
+        if not group or not group['members']:
+            return
+        url = group['url']
+        settings = group['settings']
+        member_ids = list(group['members'])
+        timeout = min(group['members'].values())
+    monitors = [monitor_registry[i] for i in member_ids if i in monitor_registry]
+    if not monitors:
+        return
+
+    result = probe_url(url, timeout, settings)
+
+    session = Session()
+    try:
+        slow = {monitor.id: record_check(session, monitor, result) for monitor in monitors}
+        persist_checks(session, monitors)
+        session.commit()
+    finally:
+        session.close()
+    for monitor in monitors:
+        refresh_probe_interval(monitor)
+        send_alerts(monitor, result, slow[monitor.id])
 
 def get_user_by_chat(chat_id: int) -> User:
     return db_session.query(User).filter_by(chat_id=str(chat_id)).first()
@@ -353,6 +1414,25 @@ def format_datetime(dt: datetime) -> str:
         return t('never')
     return dt.astimezone(INDIAN_TIMEZONE).strftime("%Y-%m-%d %H:%M:%S")
 
+def escape_md(text: str) -> str:
+    """Escape user supplied text for parse_mode='Markdown' messages"""
+    return re.sub(r'([_*`\[])', r'\\\1', text)
+
+def split_message(lines: list, separator: str = "\n") -> list:
+    """Join lines into as few messages as fit TELEGRAM_MESSAGE_LIMIT, never splitting a line"""
+    messages, current = [], ""
+    for line in lines:
+        line = line[:TELEGRAM_MESSAGE_LIMIT]
+        candidate = f"{current}{separator}{line}" if current else line
+        if len(candidate) > TELEGRAM_MESSAGE_LIMIT:
+            messages.append(current)
+            current = line
+        else:
+            current = candidate
+    if current:
+        messages.append(current)
+    return messages
+
 def main_menu_markup(chat_id: int) -> types.ReplyKeyboardMarkup:
     markup = types.ReplyKeyboardMarkup(resize_keyboard=True)
     markup.row(
@@ -369,9 +1449,114 @@ def monitor_actions_markup(monitor_id: int, chat_id: int) -> types.InlineKeyboar
     return quick_markup({
         t('edit_monitor', chat_id=chat_id): {'callback_data': f'edit_{monitor_id}'},
         t('delete_monitor', chat_id=chat_id): {'callback_data': f'delete_{monitor_id}'},
-        t('pause_monitor', chat_id=chat_id): {'callback_data': f'toggle_{monitor_id}'}
+        t('pause_monitor', chat_id=chat_id): {'callback_data': f'toggle_{monitor_id}'},
+        t('check_mode', chat_id=chat_id): {'callback_data': f'mode_{monitor_id}'},
+        t('adaptive_toggle', chat_id=chat_id): {'callback_data': f'adaptive_{monitor_id}'},
+        t('back', chat_id=chat_id): {'callback_data': 'mpage_all_n_0_1'}
     }, row_width=2)
 
+def fetch_monitor_page(user_id: int, monitor_filter: str, anchor: Monitor = None,
+                       backward: bool = False) -> tuple[list, bool, bool]:
+    """Load one page of monitors using keyset pagination.
+
+    Pages follow the (is_active desc, name, id) ordering and continue after
+    (or, going backward, before) the anchor monitor, so every page costs one
+    range scan on ix_monitor_user_active_name regardless of how deep it is.
+    Returns (monitors, has_prev, has_next).
+    """
+    query = db_session.query(Monitor).filter(Monitor.user_id == user_id)
+    if monitor_filter == 'down':
+        query = query.filter(Monitor.is_active == True, Monitor.status == 'down')  # noqa: E712
+    elif monitor_filter == 'paused':
+        query = query.filter(Monitor.is_active == False)  # noqa: E712
+
+    if anchor is not None:
+        # Booleans only support equality, so "is_active before/after the anchor's"
+        # is spelled out: active rows come first in (is_active desc) order
+        if backward:
+            other_active = Monitor.is_active == True if not anchor.is_active else false()  # noqa: E712
+            query = query.filter(or_(
+                other_active,
+                and_(Monitor.is_active == anchor.is_active, or_(
+                    Monitor.name < anchor.name,
+                    and_(Monitor.name == anchor.name, Monitor.id < anchor.id)))))
+        else:
+            other_active = Monitor.is_active == False if anchor.is_active else false()  # noqa: E712
+            query = query.filter(or_(
+                other_active,
+                and_(Monitor.is_active == anchor.is_active, or_(
+                    Monitor.name > anchor.name,
+                    and_(Monitor.name == anchor.name, Monitor.id > anchor.id)))))
+
+    if backward:
+        query = query.order_by(Monitor.is_active.asc(), Monitor.name.desc(), Monitor.id.desc())
+    else:
+        query = query.order_by(Monitor.is_active.desc(), Monitor.name.asc(), Monitor.id.asc())
+
+    # Fetch one extra row to learn whether another page exists
+    monitors = query.limit(MONITORS_PAGE_SIZE + 1).all()
+    has_more = len(monitors) > MONITORS_PAGE_SIZE
+    monitors = monitors[:MONITORS_PAGE_SIZE]
+    if backward:
+        return list(reversed(monitors)), has_more, True
+    return monitors, anchor is not None, has_more
+
+def monitor_page_view(user: User, chat_id: int, monitor_filter: str = 'all', anchor: Monitor = None,
+                      backward: bool = False, page: int = 1) -> tuple[str, types.InlineKeyboardMarkup]:
+    monitors, has_prev, has_next = fetch_monitor_page(user.id, monitor_filter, anchor, backward)
+    filter_label = t(f'filter_{monitor_filter}', chat_id=chat_id)
+
+    markup = types.InlineKeyboardMarkup()
+    if monitors:
+        text = t('monitors_page', filter=filter_label, page=page, chat_id=chat_id) + "\n\n"
+        for monitor in monitors:
+            status_emoji = "🟢" if monitor.status == 'up' else ("🔴" if monitor.status == 'down' else "⚪️")
+            pause_emoji = " ⏸️" if not monitor.is_active else ""
+            text += f"{status_emoji}{pause_emoji} {monitor.name}\n"
+            markup.add(types.InlineKeyboardButton(
+                f"{'⏸️ ' if not monitor.is_active else ''}{monitor.name}",
+                callback_data=f"details_{monitor.id}"
+            ))
+    else:
+        text = t('no_monitors_filter', chat_id=chat_id)
+
+    # Callback data carries the anchor id; the anchor row itself is a primary key lookup
+    nav = []
+    if has_prev and monitors:
+        nav.append(types.InlineKeyboardButton(
+            t('page_prev', chat_id=chat_id),
+            callback_data=f"mpage_{monitor_filter}_p_{monitors[0].id}_{page - 1}"
+        ))
+    if has_next and monitors:
+        nav.append(types.InlineKeyboardButton(
+            t('page_next', chat_id=chat_id),
+            callback_data=f"mpage_{monitor_filter}_n_{monitors[-1].id}_{page + 1}"
+        ))
+    if nav:
+        markup.row(*nav)
+    markup.row(*[
+        types.InlineKeyboardButton(
+            ('• ' if key == monitor_filter else '') + t(f'filter_{key}', chat_id=chat_id),
+            callback_data=f"mpage_{key}_n_0_1"
+        )
+        for key in ('all', 'down', 'paused')
+    ])
+    return text, markup
+
+def describe_check_mode(monitor: Monitor, chat_id: int) -> str:
+    settings = probe_settings(monitor)
+    mode = t(f'mode_{settings.mode}', max_bytes=settings.max_bytes, chat_id=chat_id)
+    if settings.keyword and settings.mode == 'get':
+        key = 'mode_regex' if settings.keyword_regex else 'mode_keyword'
+        mode = t(key, mode=mode, keyword=settings.keyword, chat_id=chat_id)
+    return mode
+
+def describe_interval(monitor: Monitor, chat_id: int) -> str:
+    if not monitor.adaptive:
+        return t('interval_fixed', interval=monitor.interval, chat_id=chat_id)
+    low, high = adaptive_bounds(monitor)
+    return t('interval_adaptive', interval=check_interval(monitor), low=low, high=high, chat_id=chat_id)
+
 def confirm_delete_markup(monitor_id: int, chat_id: int) -> types.InlineKeyboardMarkup:
     return quick_markup({
         t('yes', chat_id=chat_id): {'callback_data': f'confirm_delete_{monitor_id}'},
@@ -381,9 +1566,11 @@ def confirm_delete_markup(monitor_id: int, chat_id: int) -> types.InlineKeyboard
 def settings_markup(chat_id: int) -> types.InlineKeyboardMarkup:
     user = get_user_by_chat(chat_id)
     notification_text = t('notifications_off', chat_id=chat_id) if not user.notifications else t('notifications_on', chat_id=chat_id)
+    digest_text = t('digest_setting', mode=t(f"digest_{user.digest or 'off'}", chat_id=chat_id), chat_id=chat_id)
     return quick_markup({
         t('language_settings', chat_id=chat_id): {'callback_data': 'set_lang'},
         notification_text: {'callback_data': 'toggle_notifications'},
+        digest_text: {'callback_data': 'digest_cycle'},
         t('back', chat_id=chat_id): {'callback_data': 'back_to_main'}
     }, row_width=1)
 
@@ -394,6 +1581,982 @@ def language_markup(chat_id: int) -> types.InlineKeyboardMarkup:
         t('back', chat_id=chat_id): {'callback_data': 'back_to_settings'}
     }, row_width=2)
 
+# ----- Bulk import/export -----
+
+BULK_FIELDS = ['action', 'id', 'name', 'url', 'interval', 'is_active',
+               'check_mode', 'max_bytes', 'keyword', 'keyword_regex',
+               'adaptive', 'min_interval', 'max_interval']
+BULK_ACTIONS = ('upsert', 'create', 'update', 'delete')
+
+def parse_bulk_document(filename: str, payload: bytes) -> list:
+    """Parse an uploaded CSV or JSON document into a list of row dicts"""
+    text = payload.decode('utf-8-sig')
+    if filename.lower().endswith('.json'):
+        data = json.loads(text)
+        if isinstance(data, dict):
+            data = data.get('monitors')
+        if not isinstance(data, list) or not all(isinstance(row, dict) for row in data):
+            raise ValueError("expected a list of monitor objects")
+        return data
+    return list(csv.DictReader(io.StringIO(text)))
+
+def parse_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in ('1', 'true', 'yes', 'y', 'on', 'active'):
+        return True
+    if text in ('0', 'false', 'no', 'n', 'off', 'paused'):
+        return False
+    raise ValueError(f"invalid boolean '{value}'")
+
+def check_keyword_settings(mode: str, keyword: str, keyword_regex: bool) -> None:
+    if not keyword:
+        return
+    if keyword_regex:
+        try:
+            keyword_matcher(keyword, True)
+        except re.error as e:
+            raise ValueError(f"invalid keyword regex: {e}")
+    if (mode or 'get') != 'get':
+        raise ValueError("keyword checks need check_mode get")
+
+def validate_bulk_row(row: dict) -> dict:
+    """Normalize one import row, raising ValueError with the reason if it is invalid.
+
+    Only the fields present in the row are returned so updates can be partial.
+    """
+    def field(key):
+        value = row.get(key)
+        if value is None or (isinstance(value, str) and not value.strip()):
+            return None
+        return value.strip() if isinstance(value, str) else value
+
+    action = str(field('action') or 'upsert').lower()
+    if action not in BULK_ACTIONS:
+        raise ValueError(f"unknown action '{action}'")
+
+    clean = {'action': action, 'id': None, 'name': None}
+    if field('id') is not None:
+        try:
+            clean['id'] = int(field('id'))
+        except (TypeError, ValueError):
+            raise ValueError(f"invalid id '{field('id')}'")
+    if field('name') is not None:
+        clean['name'] = str(field('name'))
+    if clean['id'] is None and clean['name'] is None:
+        raise ValueError("name or id is required")
+    if action == 'delete':
+        return clean
+
+    url = field('url')
+    if url is not None:
+        url = str(url)
+        if not url.startswith(('http://', 'https://')):
+            raise ValueError(f"invalid url '{url}'")
+        clean['url'] = url
+
+    interval = field('interval')
+    if interval is not None:
+        try:
+            interval = int(interval)
+        except (TypeError, ValueError):
+            raise ValueError(f"invalid interval '{interval}'")
+        if interval < MIN_CHECK_INTERVAL:
+            raise ValueError(f"interval must be at least {MIN_CHECK_INTERVAL} seconds")
+        clean['interval'] = interval
+
+    if field('is_active') is not None:
+        clean['is_active'] = parse_bool(field('is_active'))
+
+    if field('check_mode') is not None:
+        mode = str(field('check_mode')).lower()
+        if mode not in CHECK_MODES:
+            raise ValueError(f"invalid check_mode '{mode}'")
+        clean['check_mode'] = mode
+    if field('max_bytes') is not None:
+        try:
+            clean['max_bytes'] = int(field('max_bytes'))
+        except (TypeError, ValueError):
+            raise ValueError(f"invalid max_bytes '{field('max_bytes')}'")
+        if clean['max_bytes'] <= 0:
+            raise ValueError("max_bytes must be positive")
+    if field('keyword_regex') is not None:
+        clean['keyword_regex'] = parse_bool(field('keyword_regex'))
+    if field('keyword') is not None:
+        clean['keyword'] = str(field('keyword'))
+    check_keyword_settings(clean.get('check_mode'), clean.get('keyword'), clean.get('keyword_regex'))
+
+    if field('adaptive') is not None:
+        clean['adaptive'] = parse_bool(field('adaptive'))
+    for key in ('min_interval', 'max_interval'):
+        if field(key) is not None:
+            try:
+                clean[key] = int(field(key))
+            except (TypeError, ValueError):
+                raise ValueError(f"invalid {key} '{field(key)}'")
+            if clean[key] < MIN_CHECK_INTERVAL:
+                raise ValueError(f"{key} must be at least {MIN_CHECK_INTERVAL} seconds")
+    if clean.get('max_interval', float('inf')) < clean.get('min_interval', 0):
+        raise ValueError("max_interval must not be below min_interval")
+    return clean
+
+def apply_bulk_rows(user: User, rows: list) -> tuple[list, list, Dict[str, int], list]:
+    """Create, update or delete the user's monitors from import rows in a single transaction.
+
+    Returns (monitors to schedule, deleted monitor ids, counts, per-row errors).
+    Invalid rows are skipped and reported; valid rows are all committed together.
+    """
+    existing = db_session.query(Monitor).filter_by(user_id=user.id).all()
+    by_id = {m.id: m for m in existing}
+    by_name = {m.name: m for m in existing}
+
+    counts = {'created': 0, 'updated': 0, 'deleted': 0}
+    changed, deleted, errors = {}, [], []
+    new_monitors, to_delete = [], []
+
+    for number, row in enumerate(rows, start=1):
+        try:
+            data = validate_bulk_row(row)
+            action = data.pop('action')
+            monitor_id = data.pop('id')
+            if monitor_id is not None:
+                monitor = by_id.get(monitor_id)
+                if monitor is None:
+                    raise ValueError(f"monitor {monitor_id} not found")
+            else:
+                monitor = by_name.get(data['name'])
+            if data['name'] is None:
+                data.pop('name')
+
+            if action == 'delete':
+                if monitor is None:
+                    raise ValueError(f"monitor '{data.get('name')}' not found")
+                by_id.pop(monitor.id, None)
+                by_name.pop(monitor.name, None)
+                changed.pop(id(monitor), None)
+                if monitor in new_monitors:
+                    new_monitors.remove(monitor)
+                    db_session.expunge(monitor)
+                    counts['created'] -= 1
+                else:
+                    deleted.append(monitor.id)
+                    to_delete.append(monitor)
+                    counts['deleted'] += 1
+                continue
+
+            if monitor is None and action == 'update':
+                raise ValueError(f"monitor '{data.get('name')}' not found")
+            if monitor is not None and action == 'create':
+                raise ValueError(f"monitor '{monitor.name}' already exists")
+
+            # A row may change only some keyword fields, so check them as the monitor will end up
+            check_keyword_settings(*(
+                data[key] if key in data else getattr(monitor, key, None)
+                for key in ('check_mode', 'keyword', 'keyword_regex')
+            ))
+
+            if monitor is None:
+                if 'url' not in data:
+                    raise ValueError("url is required for new monitors")
+                monitor = Monitor(user_id=user.id, interval=60, is_active=True)
+                new_monitors.append(monitor)
+                db_session.add(monitor)
+                counts['created'] += 1
+            elif monitor not in new_monitors:
+                counts['updated'] += 1
+
+            if 'name' in data and data['name'] != monitor.name:
+                by_name.pop(monitor.name, None)
+            for key, value in data.items():
+                setattr(monitor, key, value)
+            by_name[monitor.name] = monitor
+            changed[id(monitor)] = monitor
+        except ValueError as e:
+            errors.append(f"#{number}: {e}")
+
+    try:
+        pause_incidents(db_session, [m for m in changed.values() if not m.is_active and m not in new_monitors],
+                        datetime.utcnow())
+        # Child rows first, so backends that enforce foreign keys accept the deletes
+        delete_monitor_rows(db_session, deleted)
+        for monitor in to_delete:
+            db_session.delete(monitor)
+        db_session.commit()
+    except Exception:
+        db_session.rollback()
+        raise
+    return list(changed.values()), deleted, counts, errors
+
+def export_monitors(user: User, fmt: str) -> bytes:
+    monitors = db_session.query(Monitor).filter_by(user_id=user.id).order_by(Monitor.name).all()
+    rows = [{
+        'action': 'upsert',
+        'id': m.id,
+        'name': m.name,
+        'url': m.url,
+        'interval': m.interval,
+        'is_active': bool(m.is_active),
+        'check_mode': m.check_mode or 'get',
+        'max_bytes': m.max_bytes or '',
+        'keyword': m.keyword or '',
+        'keyword_regex': bool(m.keyword_regex),
+        'adaptive': bool(m.adaptive),
+        'min_interval': m.min_interval or '',
+        'max_interval': m.max_interval or '',
+    } for m in monitors]
+    if fmt == 'json':
+        return json.dumps({'monitors': rows}, ensure_ascii=False, indent=2).encode('utf-8')
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=BULK_FIELDS)
+    writer.writeheader()
+    writer.writerows(rows)
+    return buffer.getvalue().encode('utf-8')
+
+# ----- Rollups and digests -----
+
+# Check results are folded into hourly per-monitor rollups in memory and merged
+# into monitor_rollup once a minute, so reports never scan monitor_log.
+rollup_buffer: Dict[tuple, list] = {}  # (monitor_id, hour) -> [checks, up_checks, response_sum, histogram]
+rollup_lock = threading.Lock()
+
+# Digest messages waiting to be sent: (due time, chat_id, text), in due order
+digest_queue: deque = deque()
+digest_lock = threading.Lock()
+
+def latency_bucket(response_time: int) -> int:
+    return bisect.bisect_left(LATENCY_BUCKETS, response_time)
+
+def add_to_rollup(monitor_id: int, checked_at: datetime, status: str, response_time: int) -> None:
+    hour = checked_at.replace(minute=0, second=0, microsecond=0)
+    with rollup_lock:
+        entry = rollup_buffer.get((monitor_id, hour))
+        if entry is None:
+            entry = rollup_buffer[(monitor_id, hour)] = [0, 0, 0, [0] * (len(LATENCY_BUCKETS) + 1)]
+        entry[0] += 1
+        if status == 'up':
+            entry[1] += 1
+            entry[2] += response_time or 0
+            entry[3][latency_bucket(response_time or 0)] += 1
+
+def flush_rollups() -> None:
+    """Merge buffered rollups into monitor_rollup in one transaction"""
+    with rollup_lock:
+        pending = dict(rollup_buffer)
+        rollup_buffer.clear()
+    if not pending:
+        return
+
+    session = Session()
+    try:
+        monitor_ids = {monitor_id for monitor_id, _ in pending}
+        # Monitors deleted since their checks were buffered would fail the foreign key on every retry
+        live = {monitor_id for (monitor_id,) in session.query(Monitor.id).filter(Monitor.id.in_(monitor_ids))}
+        pending = {key: value for key, value in pending.items() if key[0] in live}
+        hours = {hour for _, hour in pending}
+        existing = {
+            (row.monitor_id, row.hour): row
+            for row in session.query(MonitorRollup).filter(
+                MonitorRollup.monitor_id.in_(monitor_ids), MonitorRollup.hour.in_(hours))
+        }
+        for (monitor_id, hour), (checks, up_checks, response_sum, histogram) in pending.items():
+            row = existing.get((monitor_id, hour))
+            if row is None:
+                session.add(MonitorRollup(
+                    monitor_id=monitor_id, hour=hour, checks=checks, up_checks=up_checks,
+                    response_sum=response_sum, histogram=",".join(map(str, histogram))
+                ))
+                continue
+            row.checks += checks
+            row.up_checks += up_checks
+            row.response_sum += response_sum
+            merged = [a + b for a, b in zip(decode_histogram(row.histogram), histogram)]
+            row.histogram = ",".join(map(str, merged))
+        session.commit()
+    except Exception:
+        session.rollback()
+        # Put the counts back so the next flush retries them
+        with rollup_lock:
+            for key, (checks, up_checks, response_sum, histogram) in pending.items():
+                entry = rollup_buffer.setdefault(key, [0, 0, 0, [0] * (len(LATENCY_BUCKETS) + 1)])
+                entry[0] += checks
+                entry[1] += up_checks
+                entry[2] += response_sum
+                entry[3] = [a + b for a, b in zip(entry[3], histogram)]
+        raise
+    finally:
+        session.close()
+
+def decode_histogram(value: str) -> list:
+    counts = [int(part) for part in value.split(',')] if value else []
+    return counts + [0] * (len(LATENCY_BUCKETS) + 1 - len(counts))
+
+def histogram_percentile(histogram: list, fraction: float) -> int:
+    """Upper bound (ms) of the latency bucket holding the given percentile"""
+    total = sum(histogram)
+    if not total:
+        return None
+    target = total * fraction
+    seen = 0
+    for index, count in enumerate(histogram):
+        seen += count
+        if seen >= target:
+            return LATENCY_BUCKETS[index] if index < len(LATENCY_BUCKETS) else LATENCY_BUCKETS[-1]
+    return LATENCY_BUCKETS[-1]
+
+def build_digests(now: datetime = None) -> list:
+    """Compute every opted-in user's digest and return [(chat_id, [message, ...])].
+
+    Monitor stats come from one pass over the rollups of the longest period due
+    today and incident stats from one incident query per period, instead of
+    per-user /stats style scans.
+    """
+    now = now or datetime.utcnow()
+    periods = {'daily': timedelta(days=1)}
+    # now is naive UTC; astimezone() alone would read it as the host's local time
+    if pytz.utc.localize(now).astimezone(INDIAN_TIMEZONE).weekday() == DIGEST_WEEKDAY:
+        periods['weekly'] = timedelta(days=7)
+
+    session = Session()
+    try:
+        users = session.query(User).filter(User.digest.in_(list(periods))).all()
+        if not users:
+            return []
+        user_by_id = {user.id: user for user in users}
+        monitors = (session.query(Monitor)
+                    .filter(Monitor.user_id.in_(list(user_by_id)))
+                    .order_by(Monitor.name)
+                    .all())
+        since = {monitor.id: now - periods[user_by_id[monitor.user_id].digest] for monitor in monitors}
+
+        stats = {monitor.id: [0, 0, [0] * (len(LATENCY_BUCKETS) + 1)] for monitor in monitors}
+        rows = (session.query(MonitorRollup)
+                .filter(MonitorRollup.monitor_id.in_(list(stats)),
+                        MonitorRollup.hour >= now - max(periods.values()))
+                .all())
+        for row in rows:
+            if row.hour < since[row.monitor_id]:
+                continue
+            entry = stats[row.monitor_id]
+            entry[0] += row.checks
+            entry[1] += row.up_checks
+            entry[2] = [a + b for a, b in zip(entry[2], decode_histogram(row.histogram))]
+
+        incidents = {}
+        for period, length in periods.items():
+            ids = [m.id for m in monitors if user_by_id[m.user_id].digest == period]
+            if ids:
+                incidents.update(incident_stats(session, ids, now - length, now))
+    finally:
+        session.close()
+
+    by_user: Dict[int, list] = {}
+    for monitor in monitors:
+        by_user.setdefault(monitor.user_id, []).append(monitor)
+
+    messages = []
+    for user_id, user in user_by_id.items():
+        lang = user.language if user.language in translations else LANGUAGE
+        strings = translations[lang]
+        lines = [strings['digest_title_' + user.digest]]
+        for monitor in by_user.get(user_id, []):
+            checks, up_checks, histogram = stats[monitor.id]
+            incident = incidents.get(monitor.id, {})
+            p95 = histogram_percentile(histogram, 0.95)
+            lines.append(strings['digest_line'].format(
+                name=escape_md(monitor.name),
+                uptime=round(100.0 * up_checks / checks, 2) if checks else strings.get('na', 'na'),
+                p95=f"≤{p95}" if p95 is not None else strings.get('na', 'na'),
+                incidents=incident.get('incidents', 0),
+                downtime=format_duration(incident.get('downtime', 0))
+            ))
+        if len(lines) == 1:
+            lines.append(strings['no_monitors'])
+        messages.append((user.chat_id, split_message(lines)))
+    return messages
+
+def queue_digests() -> None:
+    """Build today's digests and spread their delivery across the off-peak window"""
+    flush_rollups()
+    messages = build_digests()
+    if not messages:
+        return
+    window = DIGEST_WINDOW_HOURS * 3600
+    spacing = max(window / len(messages), 1.0 / DIGEST_MAX_PER_SECOND)
+    start = time.time()
+    with digest_lock:
+        for index, (chat_id, parts) in enumerate(messages):
+            # A long digest goes out as consecutive messages in the user's slot
+            for part in parts:
+                digest_queue.append((start + index * spacing, chat_id, part))
+
+def send_due_digests() -> None:
+    """Send queued digests whose slot has come, never faster than DIGEST_MAX_PER_SECOND"""
+    now = time.time()
+    sent = 0
+    while sent < DIGEST_MAX_PER_SECOND * DIGEST_TICK_SECONDS:
+        with digest_lock:
+            if not digest_queue or digest_queue[0][0] > now:
+                return
+            _, chat_id, message = digest_queue.popleft()
+        try:
+            notify(chat_id, message, parse_mode='Markdown')
+        except Exception:
+            pass
+        sent += 1
+        time.sleep(1.0 / DIGEST_MAX_PER_SECOND)
+
+# ----- Cron jobs -----
+
+# Cron jobs don't get a scheduler job each. Every active job has one entry in
+# cron_jobs and its next fire time in the cron_heap min-heap; a single tick pops
+# whatever is due. Rescheduling bumps the entry's version, which turns the old
+# heap item into a tombstone that is dropped when it surfaces.
+
+class CronRequest(NamedTuple):
+    method: str
+    url: str
+    headers: dict
+    body: str = None
+
+cron_jobs: Dict[int, Dict[str, Any]] = {}
+cron_heap: list = []  # (fire timestamp, job id, version)
+cron_versions = itertools.count()
+cron_lock = threading.Lock()
+cron_history: list = []  # finished executions waiting for the next flush
+cron_history_lock = threading.Lock()
+cron_executor = ThreadPoolExecutor(max_workers=CRON_WORKERS, thread_name_prefix='cron')
+cron_http = threading.local()
+
+CRON_WEEKDAYS = ('sun', 'mon', 'tue', 'wed', 'thu', 'fri', 'sat')  # crontab order, 0 (or 7) is Sunday
+
+def weekday_number(token: str) -> int:
+    if token.isdigit() and int(token) <= 7:
+        return int(token)
+    if token in CRON_WEEKDAYS:
+        return CRON_WEEKDAYS.index(token)
+    raise ValueError(f"invalid day of week '{token}'")
+
+def crontab_weekdays(field: str) -> str:
+    """Rewrite a crontab day-of-week field as day names.
+
+    APScheduler numbers weekdays from Monday, so a standard numeric field like
+    '1-5' has to be translated rather than passed through.
+    """
+    if field == '*':
+        return field
+    days = set()
+    for part in field.lower().split(','):
+        base, _, step = part.partition('/')
+        if base == '*':
+            first, last = 0, 6
+        else:
+            start, _, end = base.partition('-')
+            first = weekday_number(start)
+            last = weekday_number(end) if end else (6 if step else first)
+        if last < first:
+            raise ValueError(f"invalid day of week range '{base}'")
+        if step and (not step.isdigit() or int(step) == 0):
+            raise ValueError(f"invalid day of week step '{step}'")
+        days.update(day % 7 for day in range(first, last + 1, int(step or 1)))
+    return ",".join(CRON_WEEKDAYS[day] for day in sorted(days))
+
+def cron_trigger(expression: str, timezone: str) -> CronTrigger:
+    """Build the trigger for a crontab line, raising ValueError if either part is invalid"""
+    try:
+        tz = pytz.timezone(timezone)
+    except pytz.UnknownTimeZoneError:
+        raise ValueError(f"unknown timezone '{timezone}'")
+    fields = expression.split()
+    if len(fields) != 5:
+        raise ValueError("expected 5 cron fields")
+    fields[4] = crontab_weekdays(fields[4])
+    return CronTrigger.from_crontab(" ".join(fields), timezone=tz)
+
+def parse_cron_schedule(line: str) -> tuple:
+    """Split '<5 cron fields> [timezone]' into (expression, timezone) and validate it"""
+    parts = line.split()
+    if len(parts) not in (5, 6):
+        raise ValueError("expected 5 cron fields and an optional timezone")
+    expression = " ".join(parts[:5])
+    timezone = parts[5] if len(parts) == 6 else INDIAN_TIMEZONE.zone
+    cron_trigger(expression, timezone)
+    return expression, timezone
+
+def parse_cron_request(text: str) -> CronRequest:
+    """Parse 'METHOD URL', optional 'Header: value' lines, a blank line and the body"""
+    head, _, body = text.strip().replace('\r\n', '\n').partition('\n\n')
+    lines = head.split('\n')
+    first = lines[0].split()
+    if len(first) == 1:
+        first.insert(0, 'GET')
+    if len(first) != 2:
+        raise ValueError("the first line must be 'METHOD URL'")
+    method, url = first[0].upper(), first[1]
+    if method not in CRON_METHODS:
+        raise ValueError(f"unsupported method '{method}'")
+    if not url.startswith(('http://', 'https://')):
+        raise ValueError(f"invalid url '{url}'")
+    headers = {}
+    for line in lines[1:]:
+        name, sep, value = line.partition(':')
+        if not sep or not name.strip():
+            raise ValueError(f"invalid header line '{line}'")
+        try:
+            # http.client sends header values as latin-1
+            value.encode('latin-1')
+        except UnicodeEncodeError:
+            raise ValueError(f"header '{name.strip()}' has characters that can't be sent in a header")
+        headers[name.strip()] = value.strip()
+    return CronRequest(method, url, headers, body or None)
+
+def cron_request(job: CronJob) -> CronRequest:
+    return CronRequest(job.method or 'GET', job.url, json.loads(job.headers) if job.headers else {}, job.body)
+
+def next_cron_fire(job: CronJob, now: datetime = None) -> datetime:
+    """The job's first fire time at or after now, as naive UTC like the other timestamps"""
+    now = now or datetime.now(pytz.utc)
+    fire = cron_trigger(job.expression, job.timezone or INDIAN_TIMEZONE.zone).get_next_fire_time(None, now)
+    return fire.astimezone(pytz.utc).replace(tzinfo=None) if fire else None
+
+def schedule_cron_job(job: CronJob, reset: bool = False) -> None:
+    """Load a job into the fire index, or drop it if paused.
+
+    The index entry keeps its place unless reset is set, in which case the job
+    restarts from its stored next_fire_at.
+    """
+    if 'probe' not in active_roles:
+        return
+    with cron_lock:
+        entry = cron_jobs.get(job.id)
+        if not job.is_active or job.next_fire_at is None:
+            cron_jobs.pop(job.id, None)
+            return
+        details = {
+            'trigger': cron_trigger(job.expression, job.timezone or INDIAN_TIMEZONE.zone),
+            'misfire': job.misfire or 'once',
+            'request': cron_request(job),
+            'stamp': job.updated_at,
+        }
+        if entry is not None and not reset:
+            entry.update(details)
+            return
+        version = next(cron_versions)
+        cron_jobs[job.id] = dict(details, version=version)
+        heapq.heappush(cron_heap, (pytz.utc.localize(job.next_fire_at).timestamp(), job.id, version))
+
+def unschedule_cron_job(job_id: int) -> None:
+    with cron_lock:
+        cron_jobs.pop(job_id, None)
+
+def sync_cron_jobs() -> None:
+    """Follow cron jobs that a bot in another process created, changed, paused or deleted"""
+    session = Session()
+    try:
+        stamps = dict(session.query(CronJob.id, CronJob.updated_at).filter(CronJob.is_active == True))
+        with cron_lock:
+            known = {job_id: entry['stamp'] for job_id, entry in cron_jobs.items()}
+        for job_id in set(known) - set(stamps):
+            unschedule_cron_job(job_id)
+        changed = [job_id for job_id, stamp in stamps.items() if job_id not in known or known[job_id] != stamp]
+        for start in range(0, len(changed), 500):
+            for job in session.query(CronJob).filter(CronJob.id.in_(changed[start:start + 500])):
+                # Known jobs keep their place in the index; new or resumed ones start from next_fire_at
+                schedule_cron_job(job, reset=job.id not in known)
+    finally:
+        session.close()
+
+def load_cron_jobs() -> None:
+    """Build the fire index from the database; missed runs are handled by the first tick"""
+    jobs = db_session.query(CronJob).filter_by(is_active=True).all()
+    for job in jobs:
+        if job.next_fire_at is None:
+            job.next_fire_at = next_cron_fire(job)
+    db_session.commit()
+    for job in jobs:
+        schedule_cron_job(job, reset=True)
+
+def due_fires(trigger: CronTrigger, fire: datetime, now: datetime, misfire: str) -> tuple:
+    """Return (fire times to run now, next fire time) for a job whose fire time has passed"""
+    upcoming = trigger.get_next_fire_time(fire, fire)
+    if upcoming is None or upcoming > now:
+        # A single run is due; it only counts as missed if it is well overdue
+        if misfire != 'skip' or now - fire <= timedelta(seconds=CRON_MISFIRE_GRACE):
+            return [fire], upcoming
+        return [], upcoming
+    if misfire == 'all':
+        fires = [fire]
+        while upcoming is not None and upcoming <= now and len(fires) < CRON_MAX_CATCHUP:
+            fires.append(upcoming)
+            upcoming = trigger.get_next_fire_time(upcoming, upcoming)
+        if upcoming is not None and upcoming <= now:
+            upcoming = trigger.get_next_fire_time(None, now)
+        return fires, upcoming
+    # Jump past the backlog without walking it; a fire within the grace period still runs next tick
+    upcoming = trigger.get_next_fire_time(None, now - timedelta(seconds=CRON_MISFIRE_GRACE))
+    return ([fire] if misfire == 'once' else []), upcoming
+
+cron_synced_at = 0.0
+
+def cron_tick() -> None:
+    """Dispatch every due cron run and persist the new fire times"""
+    global cron_synced_at
+    if 'bot' not in active_roles and time.monotonic() - cron_synced_at >= ROLE_SYNC_SECONDS:
+        # Synced from the tick, never alongside it, so a reload can't race a fire time write
+        cron_synced_at = time.monotonic()
+        sync_cron_jobs()
+    now = datetime.now(pytz.utc)
+    due, next_fires = [], {}
+    with cron_lock:
+        while cron_heap and cron_heap[0][0] <= now.timestamp():
+            timestamp, job_id, version = heapq.heappop(cron_heap)
+            entry = cron_jobs.get(job_id)
+            if entry is None or entry['version'] != version:
+                continue
+            fire = datetime.fromtimestamp(timestamp, pytz.utc)
+            fires, upcoming = due_fires(entry['trigger'], fire, now, entry['misfire'])
+            due.extend((job_id, entry['request'], fire_at) for fire_at in fires)
+            if upcoming is None:
+                del cron_jobs[job_id]
+            else:
+                heapq.heappush(cron_heap, (upcoming.timestamp(), job_id, version))
+            next_fires[job_id] = upcoming
+
+    for job_id, request, fire_at in due:
+        cron_executor.submit(run_cron_request, job_id, request, fire_at)
+    flush_cron_state(next_fires)
+
+def cron_http_session() -> requests.Session:
+    # One keep-alive session per worker thread, since many jobs call the same hosts
+    if not hasattr(cron_http, 'session'):
+        cron_http.session = requests.Session()
+    return cron_http.session
+
+def run_cron_request(job_id: int, request: CronRequest, fire_at: datetime) -> None:
+    started_at = datetime.utcnow()
+    start = time.monotonic()
+    status_code = error = None
+    try:
+        with cron_http_session().request(
+            request.method, request.url, headers=request.headers,
+            data=request.body.encode('utf-8') if request.body else None,
+            timeout=CRON_REQUEST_TIMEOUT, stream=True
+        ) as resp:
+            status_code = resp.status_code
+            if not resp.ok:
+                error = f"HTTP {resp.status_code} {resp.reason or ''}".strip()
+    except Exception as e:
+        # Anything else would be lost inside the executor, so record it as a failed run
+        error = (str(e) or type(e).__name__)[:500]
+    with cron_history_lock:
+        cron_history.append({
+            'job_id': job_id,
+            'scheduled_at': fire_at.astimezone(pytz.utc).replace(tzinfo=None),
+            'started_at': started_at,
+            'status_code': status_code,
+            'response_time': int((time.monotonic() - start) * 1000),
+            'error': error,
+        })
+
+def flush_cron_state(next_fires: Dict[int, datetime]) -> None:
+    """Write new fire times, then finished executions, each in its own transaction.
+
+    Fire times go first so a failing history insert can never stop them from
+    being saved and make a restart replay the backlog.
+    """
+    with cron_history_lock:
+        history = list(cron_history)
+        cron_history.clear()
+    if not next_fires and not history:
+        return
+
+    session = Session()
+    try:
+        if next_fires:
+            session.execute(
+                CronJob.__table__.update()
+                .where(CronJob.id == bindparam('job_id'))
+                .values(next_fire_at=bindparam('next_fire')),
+                [{'job_id': job_id, 'next_fire': fire.astimezone(pytz.utc).replace(tzinfo=None) if fire else None}
+                 for job_id, fire in next_fires.items()]
+            )
+            session.commit()
+        if history:
+            # Jobs deleted while a run was in flight would fail the foreign key on every retry
+            job_ids = {entry['job_id'] for entry in history}
+            live = {job_id for (job_id,) in session.query(CronJob.id).filter(CronJob.id.in_(job_ids))}
+            history = [entry for entry in history if entry['job_id'] in live]
+            if history:
+                session.execute(CronExecution.__table__.insert(), history)
+                session.commit()
+    except Exception:
+        session.rollback()
+        # Keep the executions for the next flush; fire times are rewritten on the next run anyway
+        with cron_history_lock:
+            cron_history[:0] = history
+        raise
+    finally:
+        session.close()
+
+def delete_cron_rows(session, job_ids: list) -> None:
+    """Delete cron jobs together with their execution history"""
+    if not job_ids:
+        return
+    session.query(CronExecution).filter(CronExecution.job_id.in_(job_ids)).delete(synchronize_session=False)
+    session.query(CronJob).filter(CronJob.id.in_(job_ids)).delete(synchronize_session='fetch')
+
+def prune_cron_history() -> None:
+    session = Session()
+    try:
+        cutoff = datetime.utcnow() - timedelta(days=CRON_HISTORY_DAYS)
+        session.query(CronExecution).filter(CronExecution.started_at < cutoff).delete(synchronize_session=False)
+        session.commit()
+    finally:
+        session.close()
+
+def format_fire_time(fire: datetime, timezone: str) -> str:
+    if fire is None:
+        return t('never')
+    return pytz.utc.localize(fire).astimezone(pytz.timezone(timezone)).strftime("%Y-%m-%d %H:%M %Z")
+
+def cron_list_markup(jobs: list, chat_id: int) -> types.InlineKeyboardMarkup:
+    markup = types.InlineKeyboardMarkup()
+    for job in jobs:
+        icon = '⏰' if job.is_active else '⏸️'
+        markup.add(types.InlineKeyboardButton(f"{icon} {job.name}", callback_data=f"cron_{job.id}"))
+    return markup
+
+def cron_actions_markup(job_id: int, chat_id: int) -> types.InlineKeyboardMarkup:
+    return quick_markup({
+        t('cron_toggle', chat_id=chat_id): {'callback_data': f'crontoggle_{job_id}'},
+        t('cron_misfire', chat_id=chat_id): {'callback_data': f'cronmisfire_{job_id}'},
+        t('cron_delete', chat_id=chat_id): {'callback_data': f'crondelete_{job_id}'},
+        t('back', chat_id=chat_id): {'callback_data': 'cronlist'}
+    }, row_width=2)
+
+def cron_job_view(job: CronJob, chat_id: int) -> str:
+    runs = (db_session.query(CronExecution)
+            .filter_by(job_id=job.id)
+            .order_by(CronExecution.scheduled_at.desc())
+            .limit(CRON_HISTORY_SHOWN)
+            .all())
+    timezone = job.timezone or INDIAN_TIMEZONE.zone
+    history = "\n".join(
+        t('cron_run_line',
+          time=format_fire_time(run.scheduled_at, timezone),
+          result=run.error or run.status_code,
+          response_time=run.response_time,
+          chat_id=chat_id)
+        for run in runs
+    ) or t('cron_no_runs', chat_id=chat_id)
+    return t('cron_details',
+             name=job.name,
+             expression=job.expression,
+             timezone=timezone,
+             method=job.method or 'GET',
+             url=job.url,
+             state=t('cron_active' if job.is_active else 'cron_paused', chat_id=chat_id),
+             next_fire=format_fire_time(job.next_fire_at, timezone),
+             misfire=t(f'cron_misfire_{job.misfire or "once"}', chat_id=chat_id),
+             history=history,
+             chat_id=chat_id)
+
+# ----- Status page -----
+
+# Public status pages are served from this in-memory snapshot, which check
+# results update entry by entry. Rendered bodies are cached per page version,
+# so a request never touches the database and an unchanged page costs only an
+# ETag comparison.
+status_pages: Dict[str, Dict[str, Any]] = {}  # token -> {'title', 'version', 'monitors'}
+status_page_of_monitor: Dict[int, str] = {}  # monitor id -> token
+status_renders: Dict[tuple, tuple] = {}  # (token, fmt, ids) -> (version, etag, body, gzipped body)
+status_lock = threading.Lock()
+
+def status_entry(monitor: Monitor) -> Dict[str, Any]:
+    return {
+        'id': monitor.id,
+        'name': monitor.name,
+        'status': 'paused' if not monitor.is_active else (monitor.status or 'unknown'),
+        'last_checked': monitor.last_checked.isoformat() + 'Z' if monitor.last_checked else None,
+        'response_time': monitor.response_time,
+        'uptime': round(monitor.uptime_percentage or 0.0, 2),
+    }
+
+def load_status_snapshot() -> None:
+    """Build the snapshot for every user with a status page in one query.
+
+    Also run periodically on status nodes that don't share a process with the
+    bot and probes; only pages whose content changed get a new version.
+    """
+    session = Session()
+    try:
+        rows = (session.query(User, Monitor)
+                .outerjoin(Monitor, Monitor.user_id == User.id)
+                .filter(User.status_token.isnot(None))
+                .all())
+        pages = {}
+        for user, monitor in rows:
+            page = pages.setdefault(user.status_token, {'title': user.username, 'monitors': {}})
+            if monitor is not None:
+                page['monitors'][monitor.id] = status_entry(monitor)
+    finally:
+        session.close()
+
+    with status_lock:
+        for token in set(status_pages) - set(pages):
+            del status_pages[token]
+        for token, page in pages.items():
+            current = status_pages.get(token)
+            if current is None:
+                # Renders cached for an earlier page under this token carry stale versions
+                for key in [key for key in status_renders if key[0] == token]:
+                    del status_renders[key]
+                status_pages[token] = dict(page, version=0)
+            elif current['title'] != page['title'] or current['monitors'] != page['monitors']:
+                current.update(page)
+                current['version'] += 1
+        status_page_of_monitor.clear()
+        for token, page in pages.items():
+            for monitor_id in page['monitors']:
+                status_page_of_monitor[monitor_id] = token
+
+def load_status_page(user: User, old_token: str = None) -> None:
+    """(Re)build one user's page, e.g. after enabling it or rotating its token"""
+    with status_lock:
+        old_page = status_pages.pop(old_token, None) if old_token else None
+        if old_page is not None:
+            for monitor_id in old_page['monitors']:
+                status_page_of_monitor.pop(monitor_id, None)
+        if not user.status_token:
+            return
+        page = {'title': user.username, 'version': 0, 'monitors': {}}
+        for monitor in db_session.query(Monitor).filter_by(user_id=user.id):
+            page['monitors'][monitor.id] = status_entry(monitor)
+            status_page_of_monitor[monitor.id] = user.status_token
+        status_pages[user.status_token] = page
+
+def update_status_entry(monitor: Monitor, user: User = None) -> None:
+    """Refresh one monitor's entry; new monitors are added when their owner is given"""
+    with status_lock:
+        token = status_page_of_monitor.get(monitor.id)
+        if token is None and user is not None and user.status_token in status_pages:
+            token = user.status_token
+            status_page_of_monitor[monitor.id] = token
+        page = status_pages.get(token)
+        if page is None:
+            return
+        entry = status_entry(monitor)
+        if page['monitors'].get(monitor.id) != entry:
+            page['monitors'][monitor.id] = entry
+            page['version'] += 1
+
+def remove_status_entry(monitor_id: int) -> None:
+    with status_lock:
+        token = status_page_of_monitor.pop(monitor_id, None)
+        page = status_pages.get(token)
+        if page is not None and page['monitors'].pop(monitor_id, None) is not None:
+            page['version'] += 1
+
+def render_status_page(title: str, monitors: list) -> str:
+    rows = "".join(
+        f"<tr class=\"{html.escape(m['status'])}\"><td>{html.escape(m['name'])}</td>"
+        f"<td>{html.escape(m['status'])}</td><td>{m['uptime']}%</td>"
+        f"<td>{m['response_time'] if m['response_time'] is not None else '-'} ms</td>"
+        f"<td>{html.escape(m['last_checked'] or '-')}</td></tr>"
+        for m in monitors
+    )
+    return (
+        "<!doctype html><html><head><meta charset=\"utf-8\">"
+        f"<meta http-equiv=\"refresh\" content=\"{STATUS_PAGE_MAX_AGE * 4}\">"
+        f"<title>{html.escape(title)} status</title>"
+        "<style>body{font-family:sans-serif;margin:2em}td,th{padding:.3em .8em;text-align:left}"
+        ".up td:nth-child(2){color:#1a7f37}.down td:nth-child(2){color:#cf222e}"
+        ".paused td:nth-child(2),.unknown td:nth-child(2){color:#6e7781}</style></head><body>"
+        f"<h1>{html.escape(title)}</h1><table><tr><th>Monitor</th><th>Status</th><th>Uptime</th>"
+        f"<th>Response</th><th>Last checked (UTC)</th></tr>{rows}</table></body></html>"
+    )
+
+def get_status_render(token: str, fmt: str, ids: tuple) -> tuple:
+    """Return (etag, body, gzipped body) for a page, re-rendering only if it changed"""
+    with status_lock:
+        page = status_pages.get(token)
+        if page is None:
+            return None
+        key = (token, fmt, ids)
+        cached = status_renders.get(key)
+        if cached and cached[0] == page['version']:
+            return cached[1:]
+        version = page['version']
+        monitors = sorted(
+            (entry for monitor_id, entry in page['monitors'].items() if not ids or monitor_id in ids),
+            key=lambda entry: entry['name']
+        )
+        title = page['title']
+
+    if fmt == 'json':
+        body = json.dumps({'title': title, 'monitors': monitors}, ensure_ascii=False).encode('utf-8')
+    else:
+        body = render_status_page(title, monitors).encode('utf-8')
+    etag = hashlib.sha1(body).hexdigest()
+    rendered = (version, etag, body, gzip.compress(body))
+
+    with status_lock:
+        if len(status_renders) >= STATUS_RENDER_CACHE_SIZE:
+            status_renders.clear()
+        status_renders[key] = rendered
+    return rendered[1:]
+
+def create_status_app():
+    """Build the Flask app serving /status/<token> and /status/<token>.json"""
+    from flask import Flask, Response, request
+
+    status_app = Flask(__name__)
+
+    def status_response(token: str, fmt: str) -> Response:
+        ids = ()
+        if request.args.get('ids'):
+            try:
+                ids = tuple(sorted({int(part) for part in request.args['ids'].split(',') if part}))
+            except ValueError:
+                return Response('Invalid ids', status=400)
+        rendered = get_status_render(token, fmt, ids)
+        if rendered is None:
+            return Response('Not found', status=404)
+        etag, body, gzipped = rendered
+
+        if request.if_none_match.contains(etag):
+            response = Response(status=304)
+        elif request.accept_encodings['gzip']:
+            response = Response(gzipped)
+            response.headers['Content-Encoding'] = 'gzip'
+        else:
+            response = Response(body)
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = f'public, max-age={STATUS_PAGE_MAX_AGE}'
+        response.headers['Vary'] = 'Accept-Encoding'
+        response.mimetype = 'application/json' if fmt == 'json' else 'text/html'
+        return response
+
+    @status_app.route('/status/<token>.json')
+    def status_page_json(token: str):
+        return status_response(token, 'json')
+
+    @status_app.route('/status/<token>')
+    def status_page_html(token: str):
+        return status_response(token, 'html')
+
+    return status_app
+
+def start_status_server() -> None:
+    threading.Thread(
+        target=create_status_app().run,
+        kwargs={'host': '0.0.0.0', 'port': STATUS_PAGE_PORT},
+        daemon=True
+    ).start()
+
+def status_page_url(token: str) -> str:
+    return f"{STATUS_PAGE_BASE_URL.rstrip('/')}/status/{token}"
+
 # ----- Telegram Handlers -----
 
 @bot.message_handler(commands=['start', 'help', 'stats'])
@@ -518,6 +2681,7 @@ def process_login_password(message: types.Message) -> None:
         if user.chat_id != str(chat_id):
             user.chat_id = str(chat_id)
             db_session.commit()
+            update_registry_owner(user)
         
         bot.send_message(chat_id, t('login_success', username=username, chat_id=chat_id), 
                         reply_markup=main_menu_markup(chat_id))
@@ -543,29 +2707,13 @@ def my_monitors(message: types.Message) -> None:
         bot.send_message(chat_id, t('login_required', chat_id=chat_id))
         return
 
-    monitors = db_session.query(Monitor).filter_by(user_id=user.id).order_by(Monitor.is_active.desc(), Monitor.name).all()
-    
-    if not monitors:
+    if not db_session.query(Monitor.id).filter_by(user_id=user.id).first():
         bot.send_message(chat_id, t('no_monitors', chat_id=chat_id))
         return
 
-    # Send monitors in chunks of 5 to avoid message flooding
-    for i in range(0, len(monitors), 5):
-        chunk = monitors[i:i+5]
-        text = ""
-        for monitor in chunk:
-            status_emoji = "🟢" if monitor.status == 'up' else ("🔴" if monitor.status == 'down' else "⚪️")
-            pause_emoji = " ⏸️" if not monitor.is_active else ""
-            text += f"{status_emoji}{pause_emoji} {monitor.name}\n"
-        
-        markup = types.InlineKeyboardMarkup()
-        for monitor in chunk:
-            markup.add(types.InlineKeyboardButton(
-                f"{'⏸️ ' if not monitor.is_active else ''}{monitor.name}",
-                callback_data=f"details_{monitor.id}"
-            ))
-        
-        bot.send_message(chat_id, text, reply_markup=markup)
+    # One message per view; paging and filters edit it in place
+    text, markup = monitor_page_view(user, chat_id)
+    bot.send_message(chat_id, text, reply_markup=markup)
 
 @bot.message_handler(func=lambda m: m.text == t('add_monitor', chat_id=m.chat.id))
 def add_monitor_start(message: types.Message) -> None:
@@ -614,7 +2762,7 @@ def add_monitor_interval(message: types.Message) -> None:
     chat_id = message.chat.id
     try:
         interval = int(message.text.strip())
-        if interval < 10:
+        if interval < MIN_CHECK_INTERVAL:
             raise ValueError
     except ValueError:
         msg = bot.send_message(chat_id, t('invalid_interval', chat_id=chat_id))
@@ -673,8 +2821,20 @@ def logout(message: types.Message) -> None:
     user_states.pop(chat_id, None)
     
     # Remove user session
-    db_session.delete(user)
-    db_session.commit()
+    update_registry_owner(user, logged_out=True)
+    old_token, user.status_token = user.status_token, None
+    load_status_page(user, old_token)
+    # Cron jobs can't outlive their owner: nobody could see or stop them
+    job_ids = [job_id for (job_id,) in db_session.query(CronJob.id).filter_by(user_id=user.id)]
+    try:
+        delete_cron_rows(db_session, job_ids)
+        db_session.delete(user)
+        db_session.commit()
+    except Exception:
+        db_session.rollback()
+        raise
+    for job_id in job_ids:
+        unschedule_cron_job(job_id)
     
     markup = types.ReplyKeyboardMarkup(resize_keyboard=True, one_time_keyboard=True)
     markup.row(
@@ -683,8 +2843,291 @@ def logout(message: types.Message) -> None:
     )
     bot.send_message(chat_id, t('logged_out', chat_id=chat_id), reply_markup=markup)
 
+@bot.message_handler(commands=['import'])
+def import_instructions(message: types.Message) -> None:
+    chat_id = message.chat.id
+    if not get_user_by_chat(chat_id):
+        bot.send_message(chat_id, t('login_required', chat_id=chat_id))
+        return
+    bot.send_message(chat_id, t('import_instructions', chat_id=chat_id))
+
+@bot.message_handler(content_types=['document'])
+def import_monitors(message: types.Message) -> None:
+    chat_id = message.chat.id
+    user = get_user_by_chat(chat_id)
+
+    if not user:
+        bot.send_message(chat_id, t('login_required', chat_id=chat_id))
+        return
+
+    document = message.document
+    filename = document.file_name or ''
+    if not filename.lower().endswith(('.csv', '.json')):
+        bot.send_message(chat_id, t('import_unsupported', chat_id=chat_id))
+        return
+    if document.file_size and document.file_size > BULK_MAX_BYTES:
+        bot.send_message(chat_id, t('import_too_large', max_rows=BULK_MAX_ROWS, chat_id=chat_id))
+        return
+
+    try:
+        payload = bot.download_file(bot.get_file(document.file_id).file_path)
+        rows = parse_bulk_document(filename, payload)
+    except (ValueError, UnicodeDecodeError, csv.Error) as e:
+        bot.send_message(chat_id, t('import_failed', error=e, chat_id=chat_id))
+        return
+    if len(rows) > BULK_MAX_ROWS:
+        bot.send_message(chat_id, t('import_too_large', max_rows=BULK_MAX_ROWS, chat_id=chat_id))
+        return
+
+    try:
+        changed, deleted, counts, errors = apply_bulk_rows(user, rows)
+    except Exception as e:
+        bot.send_message(chat_id, t('import_failed', error=e, chat_id=chat_id))
+        return
+
+    for monitor_id in deleted:
+        unschedule_monitor(monitor_id)
+    schedule_monitors(changed, user)
+
+    text = t('import_result', failed=len(errors), chat_id=chat_id, **counts)
+    if errors:
+        # Keep the report within Telegram's message size limit
+        shown = errors[:30]
+        if len(errors) > len(shown):
+            shown.append(f"... (+{len(errors) - len(shown)})")
+        text += "\n\n" + t('import_errors', errors="\n".join(shown), chat_id=chat_id)
+    bot.send_message(chat_id, text, reply_markup=main_menu_markup(chat_id))
+
+@bot.message_handler(commands=['export'])
+def export_monitors_command(message: types.Message) -> None:
+    chat_id = message.chat.id
+    user = get_user_by_chat(chat_id)
+
+    if not user:
+        bot.send_message(chat_id, t('login_required', chat_id=chat_id))
+        return
+
+    args = message.text.split()[1:]
+    fmt = 'json' if args and args[0].lower() == 'json' else 'csv'
+    if not user.monitors:
+        bot.send_message(chat_id, t('export_empty', chat_id=chat_id))
+        return
+
+    document = io.BytesIO(export_monitors(user, fmt))
+    document.name = f"monitors.{fmt}"
+    bot.send_document(chat_id, document)
+
+@bot.message_handler(commands=['incidents'])
+def incidents(message: types.Message) -> None:
+    chat_id = message.chat.id
+    user = get_user_by_chat(chat_id)
+
+    if not user:
+        bot.send_message(chat_id, t('login_required', chat_id=chat_id))
+        return
+
+    now = datetime.utcnow()
+    since = now - timedelta(days=INCIDENTS_DAYS)
+    monitors = {m.id: m for m in db_session.query(Monitor).filter_by(user_id=user.id)}
+    stats = incident_stats(db_session, list(monitors), since, now)
+    affected = [monitor_id for monitor_id, entry in stats.items() if entry['incidents']]
+    if not affected:
+        bot.send_message(chat_id, t('no_incidents', days=INCIDENTS_DAYS, chat_id=chat_id))
+        return
+
+    recent = (db_session.query(Incident)
+              .filter(Incident.monitor_id.in_(affected),
+                      or_(Incident.ended_at.is_(None), Incident.ended_at > since))
+              .order_by(Incident.started_at.desc())
+              .all())
+    by_monitor: Dict[int, list] = {}
+    for incident in recent:
+        by_monitor.setdefault(incident.monitor_id, []).append(incident)
+
+    sections = [t('incidents_title', days=INCIDENTS_DAYS, chat_id=chat_id)]
+    for monitor_id in sorted(affected, key=lambda i: -stats[i]['downtime']):
+        entry = stats[monitor_id]
+        lines = [t('incident_summary',
+                   name=escape_md(monitors[monitor_id].name),
+                   count=entry['incidents'],
+                   sla=round(entry['sla'], 3),
+                   mttr=format_duration(entry['mttr']) if entry['mttr'] is not None else t('na', chat_id=chat_id),
+                   chat_id=chat_id)]
+        for incident in by_monitor.get(monitor_id, [])[:INCIDENTS_PER_MONITOR]:
+            if incident.ended_at:
+                duration = format_duration(incident.duration or 0)
+            else:
+                duration = t('incident_ongoing', duration=format_duration((now - incident.started_at).total_seconds()),
+                             chat_id=chat_id)
+            lines.append(t('incident_line',
+                           started=format_datetime(incident.started_at),
+                           duration=duration,
+                           error=escape_md((incident.first_error or '')[:80]),
+                           chat_id=chat_id))
+        sections.append("\n".join(lines))
+
+    for part in split_message(sections, separator="\n\n"):
+        bot.send_message(chat_id, part, parse_mode='Markdown')
+
+@bot.message_handler(commands=['statuspage'])
+def status_page_command(message: types.Message) -> None:
+    chat_id = message.chat.id
+    user = get_user_by_chat(chat_id)
+
+    if not user:
+        bot.send_message(chat_id, t('login_required', chat_id=chat_id))
+        return
+
+    args = message.text.split()[1:]
+    action = args[0].lower() if args else ''
+    old_token = user.status_token
+    if action == 'off':
+        user.status_token = None
+        db_session.commit()
+        load_status_page(user, old_token)
+        bot.send_message(chat_id, t('status_page_disabled', chat_id=chat_id))
+        return
+    if action == 'reset' or not user.status_token:
+        user.status_token = secrets.token_urlsafe(16)
+        db_session.commit()
+        load_status_page(user, old_token)
+
+    bot.send_message(chat_id, t('status_page_link', url=status_page_url(user.status_token), chat_id=chat_id),
+                     disable_web_page_preview=True)
+
+@bot.message_handler(commands=['cron'])
+def cron_jobs_command(message: types.Message) -> None:
+    chat_id = message.chat.id
+    user = get_user_by_chat(chat_id)
+
+    if not user:
+        bot.send_message(chat_id, t('login_required', chat_id=chat_id))
+        return
+
+    jobs = db_session.query(CronJob).filter_by(user_id=user.id).order_by(CronJob.name).all()
+    if not jobs:
+        bot.send_message(chat_id, t('no_cron_jobs', chat_id=chat_id))
+        return
+    bot.send_message(chat_id, t('cron_list_title', chat_id=chat_id), reply_markup=cron_list_markup(jobs, chat_id))
+
+@bot.message_handler(commands=['addcron'])
+def add_cron_start(message: types.Message) -> None:
+    chat_id = message.chat.id
+    user = get_user_by_chat(chat_id)
+
+    if not user:
+        bot.send_message(chat_id, t('login_required', chat_id=chat_id))
+        return
+
+    msg = bot.send_message(chat_id, t('cron_enter_name', chat_id=chat_id))
+    bot.register_next_step_handler(msg, add_cron_name)
+
+def add_cron_name(message: types.Message) -> None:
+    chat_id = message.chat.id
+    name = (message.text or '').strip()
+
+    if not name or name.lower() == '❌ cancel':
+        bot.send_message(chat_id, t('operation_cancelled', chat_id=chat_id),
+                         reply_markup=main_menu_markup(chat_id))
+        return
+
+    user_states[chat_id] = {'cron_name': name}
+    msg = bot.send_message(chat_id, t('cron_enter_schedule', chat_id=chat_id))
+    bot.register_next_step_handler(msg, add_cron_schedule)
+
+def add_cron_schedule(message: types.Message) -> None:
+    chat_id = message.chat.id
+    line = (message.text or '').strip()
+
+    if line.lower() == '❌ cancel':
+        bot.send_message(chat_id, t('operation_cancelled', chat_id=chat_id),
+                         reply_markup=main_menu_markup(chat_id))
+        return
+
+    try:
+        expression, timezone = parse_cron_schedule(line)
+    except ValueError as e:
+        msg = bot.send_message(chat_id, t('cron_invalid_schedule', error=e, chat_id=chat_id))
+        bot.register_next_step_handler(msg, add_cron_schedule)
+        return
+
+    if chat_id not in user_states:
+        bot.send_message(chat_id, t('cron_restart', chat_id=chat_id))
+        return
+    user_states[chat_id].update(cron_expression=expression, cron_timezone=timezone)
+    msg = bot.send_message(chat_id, t('cron_enter_request', chat_id=chat_id))
+    bot.register_next_step_handler(msg, add_cron_request)
+
+def add_cron_request(message: types.Message) -> None:
+    chat_id = message.chat.id
+    text = message.text or ''
+
+    if text.strip().lower() == '❌ cancel':
+        bot.send_message(chat_id, t('operation_cancelled', chat_id=chat_id),
+                         reply_markup=main_menu_markup(chat_id))
+        return
+
+    try:
+        request = parse_cron_request(text)
+    except ValueError as e:
+        msg = bot.send_message(chat_id, t('cron_invalid_request', error=e, chat_id=chat_id))
+        bot.register_next_step_handler(msg, add_cron_request)
+        return
+
+    data = user_states.pop(chat_id, None)
+    if not data or 'cron_expression' not in data:
+        bot.send_message(chat_id, t('cron_restart', chat_id=chat_id))
+        return
+
+    user = get_user_by_chat(chat_id)
+    job = CronJob(
+        user_id=user.id,
+        name=data['cron_name'],
+        expression=data['cron_expression'],
+        timezone=data['cron_timezone'],
+        method=request.method,
+        url=request.url,
+        headers=json.dumps(request.headers) if request.headers else None,
+        body=request.body
+    )
+    job.next_fire_at = next_cron_fire(job)
+    db_session.add(job)
+    db_session.commit()
+    schedule_cron_job(job, reset=True)
+
+    bot.send_message(
+        chat_id,
+        t('cron_added', name=job.name, next_fire=format_fire_time(job.next_fire_at, job.timezone), chat_id=chat_id),
+        reply_markup=main_menu_markup(chat_id)
+    )
+
 # ----- Callback Handlers -----
 
+@bot.callback_query_handler(func=lambda call: call.data.startswith('mpage_'))
+def monitors_page(call: types.CallbackQuery) -> None:
+    chat_id = call.message.chat.id
+    user = get_user_by_chat(chat_id)
+    if not user:
+        bot.answer_callback_query(call.id, t('login_required', chat_id=chat_id))
+        return
+
+    _, monitor_filter, direction, anchor_id, page = call.data.split('_')
+    anchor = None
+    if int(anchor_id):
+        anchor = db_session.query(Monitor).get(int(anchor_id))
+        if not anchor or anchor.user_id != user.id:
+            # Anchor was deleted meanwhile; start over from the first page
+            anchor, page = None, 1
+
+    text, markup = monitor_page_view(user, chat_id, monitor_filter, anchor,
+                                     backward=anchor is not None and direction == 'p', page=int(page))
+    try:
+        bot.edit_message_text(text, chat_id, call.message.message_id, reply_markup=markup)
+    except Exception:
+        # Telegram rejects edits that don't change anything
+        pass
+    bot.answer_callback_query(call.id)
+
 @bot.callback_query_handler(func=lambda call: call.data.startswith('details_'))
 def monitor_details(call: types.CallbackQuery) -> None:
     chat_id = call.message.chat.id
@@ -708,7 +3151,9 @@ def monitor_details(call: types.CallbackQuery) -> None:
              last_checked=format_datetime(monitor.last_checked),
              response_time=monitor.response_time or t('na', chat_id=chat_id),
              uptime=round(monitor.uptime_percentage, 2),
-             interval=monitor.interval,
+             interval=describe_interval(monitor, chat_id),
+             mode=describe_check_mode(monitor, chat_id),
+             timings=describe_timings(decode_timings(monitor.timings), chat_id),
              chat_id=chat_id)
     
     markup = monitor_actions_markup(monitor_id, chat_id)
@@ -730,7 +3175,13 @@ def toggle_monitor(call: types.CallbackQuery) -> None:
         return
     
     monitor.is_active = not monitor.is_active
-    db_session.commit()
+    try:
+        if not monitor.is_active:
+            pause_incidents(db_session, [monitor], datetime.utcnow())
+        db_session.commit()
+    except Exception:
+        db_session.rollback()
+        raise
     schedule_monitor(monitor)
     
     if monitor.is_active:
@@ -741,6 +3192,43 @@ def toggle_monitor(call: types.CallbackQuery) -> None:
     # Update the message to reflect changes
     monitor_details(call)
 
+@bot.callback_query_handler(func=lambda call: call.data.startswith('mode_'))
+def cycle_check_mode(call: types.CallbackQuery) -> None:
+    chat_id = call.message.chat.id
+    monitor_id = int(call.data.split('_')[1])
+    monitor = db_session.query(Monitor).get(monitor_id)
+    
+    if not monitor or monitor.user_id != get_user_by_chat(chat_id).id:
+        bot.answer_callback_query(call.id, t('monitor_not_found', chat_id=chat_id))
+        return
+    
+    current = monitor.check_mode or 'get'
+    monitor.check_mode = CHECK_MODES[(CHECK_MODES.index(current) + 1) % len(CHECK_MODES)]
+    db_session.commit()
+    schedule_monitor(monitor)
+    
+    bot.answer_callback_query(call.id, t('mode_changed', mode=describe_check_mode(monitor, chat_id), chat_id=chat_id))
+    monitor_details(call)
+
+@bot.callback_query_handler(func=lambda call: call.data.startswith('adaptive_'))
+def toggle_adaptive(call: types.CallbackQuery) -> None:
+    chat_id = call.message.chat.id
+    monitor_id = int(call.data.split('_')[1])
+    monitor = db_session.query(Monitor).get(monitor_id)
+    
+    if not monitor or monitor.user_id != get_user_by_chat(chat_id).id:
+        bot.answer_callback_query(call.id, t('monitor_not_found', chat_id=chat_id))
+        return
+    
+    monitor.adaptive = not monitor.adaptive
+    monitor.effective_interval = None
+    monitor.stable_checks = 0
+    db_session.commit()
+    schedule_monitor(monitor, reset=('effective_interval', 'stable_checks'))
+    
+    bot.answer_callback_query(call.id, describe_interval(monitor, chat_id))
+    monitor_details(call)
+
 @bot.callback_query_handler(func=lambda call: call.data.startswith('delete_'))
 def delete_monitor_prompt(call: types.CallbackQuery) -> None:
     chat_id = call.message.chat.id
@@ -769,13 +3257,14 @@ def confirm_delete_monitor(call: types.CallbackQuery) -> None:
         return
     
     name = monitor.name
-    # Remove scheduler job
-    job_id = f"monitor_{monitor.id}"
-    if scheduler.get_job(job_id):
-        scheduler.remove_job(job_id)
-    
-    db_session.delete(monitor)
-    db_session.commit()
+    try:
+        delete_monitor_rows(db_session, [monitor.id])
+        db_session.delete(monitor)
+        db_session.commit()
+    except Exception:
+        db_session.rollback()
+        raise
+    unschedule_monitor(monitor_id)
     
     bot.edit_message_text(
         t('monitor_deleted', name=name, chat_id=chat_id),
@@ -807,6 +3296,7 @@ def change_language(call: types.CallbackQuery) -> None:
     if user:
         user.language = lang
         db_session.commit()
+        update_registry_owner(user)
     
     bot.edit_message_text(
         t('language_changed', chat_id=chat_id),
@@ -829,6 +3319,7 @@ def toggle_notifications(call: types.CallbackQuery) -> None:
     if user:
         user.notifications = not user.notifications
         db_session.commit()
+        update_registry_owner(user)
         
         status = t('on', chat_id=chat_id) if user.notifications else t('off', chat_id=chat_id)
         bot.answer_callback_query(
@@ -844,6 +3335,29 @@ def toggle_notifications(call: types.CallbackQuery) -> None:
             reply_markup=settings_markup(chat_id)
         )
 
+@bot.callback_query_handler(func=lambda call: call.data == 'digest_cycle')
+def cycle_digest(call: types.CallbackQuery) -> None:
+    chat_id = call.message.chat.id
+    user = get_user_by_chat(chat_id)
+    
+    if user:
+        current = user.digest if user.digest in DIGEST_MODES else 'off'
+        user.digest = DIGEST_MODES[(DIGEST_MODES.index(current) + 1) % len(DIGEST_MODES)]
+        db_session.commit()
+        
+        bot.answer_callback_query(
+            call.id,
+            t('digest_setting', mode=t(f'digest_{user.digest}', chat_id=chat_id), chat_id=chat_id)
+        )
+        
+        # Update the settings menu
+        bot.edit_message_text(
+            t('settings_menu', chat_id=chat_id),
+            chat_id,
+            call.message.message_id,
+            reply_markup=settings_markup(chat_id)
+        )
+
 @bot.callback_query_handler(func=lambda call: call.data == 'back_to_main')
 def back_to_main(call: types.CallbackQuery) -> None:
     chat_id = call.message.chat.id
@@ -869,13 +3383,170 @@ def back_to_settings(call: types.CallbackQuery) -> None:
         reply_markup=settings_markup(chat_id)
     )
 
+def get_user_cron_job(call: types.CallbackQuery) -> CronJob:
+    """The cron job named in the callback data, if it belongs to the caller"""
+    chat_id = call.message.chat.id
+    job = db_session.query(CronJob).get(int(call.data.split('_')[1]))
+    user = get_user_by_chat(chat_id)
+    if not job or not user or job.user_id != user.id:
+        bot.answer_callback_query(call.id, t('cron_not_found', chat_id=chat_id))
+        return None
+    return job
+
+@bot.callback_query_handler(func=lambda call: call.data.startswith('cron_'))
+def cron_job_details(call: types.CallbackQuery) -> None:
+    job = get_user_cron_job(call)
+    if not job:
+        return
+    chat_id = call.message.chat.id
+    bot.edit_message_text(
+        cron_job_view(job, chat_id),
+        chat_id,
+        call.message.message_id,
+        reply_markup=cron_actions_markup(job.id, chat_id),
+        disable_web_page_preview=True
+    )
+
+@bot.callback_query_handler(func=lambda call: call.data == 'cronlist')
+def cron_job_list(call: types.CallbackQuery) -> None:
+    chat_id = call.message.chat.id
+    user = get_user_by_chat(chat_id)
+    if not user:
+        bot.answer_callback_query(call.id, t('login_required', chat_id=chat_id))
+        return
+    jobs = db_session.query(CronJob).filter_by(user_id=user.id).order_by(CronJob.name).all()
+    bot.edit_message_text(
+        t('cron_list_title', chat_id=chat_id) if jobs else t('no_cron_jobs', chat_id=chat_id),
+        chat_id,
+        call.message.message_id,
+        reply_markup=cron_list_markup(jobs, chat_id)
+    )
+
+@bot.callback_query_handler(func=lambda call: call.data.startswith('crontoggle_'))
+def toggle_cron_job(call: types.CallbackQuery) -> None:
+    job = get_user_cron_job(call)
+    if not job:
+        return
+    job.is_active = not job.is_active
+    # Resuming starts from the next fire time; runs missed while paused are not replayed
+    job.next_fire_at = next_cron_fire(job) if job.is_active else None
+    db_session.commit()
+    schedule_cron_job(job, reset=True)
+    bot.answer_callback_query(call.id)
+    cron_job_details(call)
+
+@bot.callback_query_handler(func=lambda call: call.data.startswith('cronmisfire_'))
+def cycle_cron_misfire(call: types.CallbackQuery) -> None:
+    job = get_user_cron_job(call)
+    if not job:
+        return
+    current = job.misfire or 'once'
+    job.misfire = CRON_MISFIRE_POLICIES[(CRON_MISFIRE_POLICIES.index(current) + 1) % len(CRON_MISFIRE_POLICIES)]
+    db_session.commit()
+    schedule_cron_job(job)
+    bot.answer_callback_query(call.id, t(f'cron_misfire_{job.misfire}', chat_id=call.message.chat.id))
+    cron_job_details(call)
+
+@bot.callback_query_handler(func=lambda call: call.data.startswith('crondelete_'))
+def delete_cron_job(call: types.CallbackQuery) -> None:
+    job = get_user_cron_job(call)
+    if not job:
+        return
+    chat_id = call.message.chat.id
+    name, job_id = job.name, job.id
+    try:
+        delete_cron_rows(db_session, [job_id])
+        db_session.commit()
+    except Exception:
+        db_session.rollback()
+        raise
+    unschedule_cron_job(job_id)
+    bot.answer_callback_query(call.id, t('cron_deleted', name=name, chat_id=chat_id))
+    cron_job_list(call)
+
+# ----- Application factory -----
+
+IMPORT_SECONDS = time.perf_counter() - _import_started
+
+def report_startup(timings: Dict[str, float]) -> None:
+    print("Startup: " + ", ".join(f"{name} {seconds * 1000:.0f}ms" for name, seconds in timings.items()))
+    if STARTUP_REPORT:
+        with open(STARTUP_REPORT, 'w') as f:
+            json.dump({name: round(seconds, 4) for name, seconds in timings.items()}, f)
+
+def create_app(roles: tuple = None) -> Dict[str, float]:
+    """Initialize the components needed by the given roles and return startup timings.
+
+    Importing this module has no side effects; the database, scheduler, bot and
+    status server are only set up here. Roles: 'bot' (Telegram handlers and
+    digests), 'probe' (uptime checks, rollups and cron jobs) and 'status' (public status
+    page, fed by the checks running in the same process).
+    """
+    active_roles.update(roles or APP_ROLES)
+    timings = {'import': IMPORT_SECONDS}
+
+    def phase(name, func, *args):
+        start = time.perf_counter()
+        result = func(*args)
+        timings[name] = time.perf_counter() - start
+        return result
+
+    phase('db', init_db)
+    # Handlers update the in-memory state of their own process only. Roles
+    # running apart from them poll the database for changes instead.
+    if 'status' in active_roles:
+        phase('status_snapshot', load_status_snapshot)
+        if not {'bot', 'probe'} <= active_roles:
+            scheduler.add_job(load_status_snapshot, trigger='interval', seconds=ROLE_SYNC_SECONDS,
+                              id='sync_status', replace_existing=True, max_instances=1)
+    if 'probe' in active_roles:
+        # Jobs live in memory only, so restore every active monitor's schedule
+        monitor_stamps.update(read_monitor_stamps(db_session))
+        phase('schedule', lambda: schedule_monitors(
+            db_session.query(Monitor).options(joinedload(Monitor.user)).filter_by(is_active=True).all()))
+        if 'bot' not in active_roles:
+            scheduler.add_job(sync_monitors, trigger='interval', seconds=ROLE_SYNC_SECONDS,
+                              id='sync_monitors', replace_existing=True, max_instances=1)
+        scheduler.add_job(flush_rollups, trigger='interval', seconds=ROLLUP_FLUSH_SECONDS, id='flush_rollups',
+                          replace_existing=True)
+        phase('cron', load_cron_jobs)
+        scheduler.add_job(cron_tick, trigger='interval', seconds=CRON_TICK_SECONDS, id='cron_tick',
+                          replace_existing=True, max_instances=1, coalesce=True)
+        scheduler.add_job(prune_cron_history, trigger='cron', hour=3, timezone=INDIAN_TIMEZONE,
+                          id='prune_cron_history', replace_existing=True)
+    if 'bot' in active_roles:
+        phase('bot', bot.setup)
+        scheduler.add_job(queue_digests, trigger='cron', hour=DIGEST_WINDOW_START, timezone=INDIAN_TIMEZONE,
+                          id='queue_digests', replace_existing=True)
+        scheduler.add_job(send_due_digests, trigger='interval', seconds=DIGEST_TICK_SECONDS,
+                          id='send_due_digests', replace_existing=True, max_instances=1)
+    phase('scheduler', scheduler.start)
+    if 'status' in active_roles and STATUS_PAGE_PORT:
+        phase('status_server', start_status_server)
+
+    timings['total'] = IMPORT_SECONDS + sum(seconds for name, seconds in timings.items() if name != 'import')
+    report_startup(timings)
+    return timings
+
 # ----- Start polling -----
 if __name__ == '__main__':
-    print("Initializing database...")
-    init_db()
+    if '--check-db' in sys.argv:
+        init_db()
+        sys.exit(0 if check_db(engine) else 1)
+    if '--profile-startup' in sys.argv:
+        # Measure a full cold start without polling; combine with
+        # `python -X importtime` for a per-module import breakdown
+        create_app()
+        scheduler.shutdown(wait=False)
+        sys.exit(0)
+
+    create_app()
     print("Bot started...")
     try:
-        bot.infinity_polling()
+        if 'bot' in active_roles:
+            bot.infinity_polling()
+        else:
+            threading.Event().wait()
     except Exception as e:
         print(f"Error: {e}")
         db_session.close()
@@ -1,4 +1,5 @@
 import os
+import json
 import subprocess
 import time
 import threading
@@ -8,6 +9,7 @@ app = Flask(__name__)
 
 APP_SCRIPT = "app2.py"
 CHECK_INTERVAL = 300  # 5 minutes
+STARTUP_REPORT = "startup.json"  # app2.py writes its startup phase timings here
 process = None
 
 def is_process_running(name):
@@ -21,7 +23,17 @@ def is_process_running(name):
 def start_app():
     global process
     print(f"Starting {APP_SCRIPT}...")
-    process = subprocess.Popen(["python3", APP_SCRIPT])
+    if os.path.exists(STARTUP_REPORT):
+        os.remove(STARTUP_REPORT)
+    env = dict(os.environ, STARTUP_REPORT=STARTUP_REPORT)
+    process = subprocess.Popen(["python3", APP_SCRIPT], env=env)
+
+def startup_timings():
+    try:
+        with open(STARTUP_REPORT) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
 
 def monitor_app():
     while True:
@@ -35,7 +47,11 @@ def monitor_app():
 @app.route("/")
 def status():
     running = is_process_running(APP_SCRIPT)
-    return f"{APP_SCRIPT} is {'running ✅' if running else 'not running ❌'}."
+    text = f"{APP_SCRIPT} is {'running ✅' if running else 'not running ❌'}."
+    timings = startup_timings()
+    if timings:
+        text += " Startup: " + ", ".join(f"{name} {seconds * 1000:.0f}ms" for name, seconds in timings.items())
+    return text
 
 if __name__ == "__main__":
     # Start monitor in background
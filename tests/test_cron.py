@@ -0,0 +1,33 @@
+from datetime import datetime
+
+import pytest
+import pytz
+
+from app2 import crontab_weekdays, cron_trigger, parse_cron_request
+
+
+def next_fire(expression, after):
+    return cron_trigger(expression, 'UTC').get_next_fire_time(None, pytz.utc.localize(after))
+
+
+def test_numeric_weekday_uses_crontab_numbering():
+    # 2026-10-18 is a Sunday
+    fire = next_fire('* * * * 1', datetime(2026, 10, 18, 12, 0))
+    assert fire.strftime('%A') == 'Monday'
+    assert next_fire('0 9 * * 0', datetime(2026, 10, 19)).strftime('%A') == 'Sunday'
+    assert next_fire('0 9 * * 7', datetime(2026, 10, 19)).strftime('%A') == 'Sunday'
+
+
+def test_weekday_field_translation():
+    assert crontab_weekdays('1-5') == 'mon,tue,wed,thu,fri'
+    assert crontab_weekdays('5-7') == 'sun,fri,sat'
+    assert crontab_weekdays('*/2') == 'sun,tue,thu,sat'
+    assert crontab_weekdays('mon,wed') == 'mon,wed'
+    with pytest.raises(ValueError):
+        crontab_weekdays('8')
+
+
+def test_header_values_must_be_latin1():
+    with pytest.raises(ValueError):
+        parse_cron_request('GET https://example.com\nX-Price: 5€')
+    assert parse_cron_request('GET https://example.com\nX-A: é').headers == {'X-A': 'é'}